@@ -1,115 +1,114 @@
-# Selenium (page navigation and driver)
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service 
-from selenium.webdriver.common.keys import Keys
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options as ChromeOptions
-from selenium.common.exceptions import NoSuchElementException, TimeoutException, NoSuchWindowException, WebDriverException
-
-# Web scraping libraries
-from bs4 import BeautifulSoup
-import requests
-
-# Tkinter GUI
-import tkinter as tk
-from tkinter import Tk, messagebox, END, Text, scrolledtext, ttk, Scrollbar
-from tkcalendar import Calendar  # Start and end dates
-import customtkinter as ctk # Custom UI
-from CTkListbox import CTkListbox
+# Browser (selenium, undetected_chromedriver), HTML parser, HTTP client, columnar
+# output and GUI libraries are imported where they are first used, so a headless
+# http run never loads the GUI or browser stack. Selenium's exception classes are
+# cheap and are needed by the shared error handling.
+from selenium.common.exceptions import NoSuchElementException, TimeoutException, NoSuchWindowException, WebDriverException, InvalidSessionIdException
+
 import threading
 from threading import Thread
+import queue # Shared work queue for driver pool
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse, urljoin
 
 import csv # Writing to CSV file
-import undetected_chromedriver as uc # Undetected chromedriver from cloudflare systems
-import time # For wait times (testing)
+import time # Cache freshness
 import math # Calculating pages
 import datetime # For adjusting dates
-import pandas as pd # Preprocessing
-import subprocess # Killing chrome
 import json # Open json files
+import sys # Command line arguments and exit codes
+import argparse # Headless command line interface
 import os # Path operations
+import hashlib # Cache file names
+import re # Dates on listing cards
+import sqlite3 # Accumulated report database
+import contextlib # Phase timers
+import random # Retry jitter
+from collections import deque # Recent request times
 
-# Scraper logic and initialisation 
-class Scraper:
-    def __init__(self, base_url, update_callback = None, output_callback = None, 
-    warning_callback = None, error_callback = None, success_callback = None):
-        # Initialise URL
-        self.base_url = base_url
-        # Initialise scraping states
-        self.scraping = False # For when scraper is currently running
-        self.pause_event = threading.Event() # For pausing scrape
-        self.scraped_data = [] # List to hold scraped data
-        self.sort_order = "desc"  # Start with descending order
-        self.page_num = 1 # Starting page number
-        self.halfway_reached = False  # Flag to indicate if page has reached halfway
-        self.pages_scraped = 0  # Track number of pages scraped
-        self.items_scraped = 0 # Track items scraped
-        self.max_items = None # User can set max items to scrape 
-        self.total_items = 0 # Find the total number of items for progress bar
-        self.scraped_urls = set() # Track scraped urls to avoid scraping the same pages
-        self.total_items_fetched = False # Check to see if total_items are fetched
-        self.pagination_fetched = False # Check to see if half page has been fetched
 
-        # Callbacks to GUI
-        self.update_callback = update_callback # Callback to set progress bar
-        self.output_callback = output_callback # Callback to output text
-        self.warning_callback = warning_callback # Callback to warning text
-        self.error_callback = error_callback # Callback to error text
-        self.success_callback = success_callback # Callback to success text
+# Import the GUI libraries into the module namespace (only when the GUI is opened)
+def import_gui_modules():
+    global tk, messagebox, filedialog, Text, Scrollbar, Calendar, ctk, CTkListbox
+    import tkinter as tk
+    from tkinter import messagebox, filedialog, Text, Scrollbar
+    from tkcalendar import Calendar  # Start and end dates
+    import customtkinter as ctk # Custom UI
+    from CTkListbox import CTkListbox
 
-        # Initalise filters
-        self.selected_countries = []  
-        self.selected_languages = []
-        self.selected_tags = []
-        self.start_date = None
-        self.end_date = None
 
-        # Initialise driver with URL
-        self.driver = self.setup_driver()
-        self.driver.get(self.base_url)
-        self.wait_for_elements("a.b-archive__database-item", 5)
+# One scraped report, indexed by column name like a CSV row
+# Slots instead of a per-row dict, and repeated categorical values (outlet, date,
+# languages, countries) are interned so every row shares one string object per value
+class ReportRecord:
+    __slots__ = ("title", "outlet", "date", "languages", "countries", "summary", "response", "url")
 
+    # Column name -> slot
+    COLUMNS = {
+        "Title": "title",
+        "Outlet": "outlet",
+        "Date of publication": "date",
+        "Article language(s)": "languages",
+        "Countries / regions discussed": "countries",
+        "Summary": "summary",
+        "Response": "response",
+        "URL": "url"
+    }
+    INTERNED = frozenset(("outlet", "date", "languages", "countries"))
 
-    def setup_driver(self):
-        # Driver setup with detailed options
-        # Options help with speed of driver by disabling chrome features
-        options = ChromeOptions()
-        options.add_argument("--disable-blink-features=AutomationControlled")
-        options.add_argument("--no-sandbox")
-        options.add_argument("--disable-gpu")
-        options.add_argument("--disable-javascript")
-        options.add_argument("--disable-extensions")
-        options.add_argument('--disable-blink-features=AutomationControlled')
+    def __init__(self):
+        for slot in self.__slots__:
+            setattr(self, slot, None)
 
-        # Initialise the driver with specified options
-        self.driver = uc.Chrome(options=options) 
+    def __getitem__(self, column):
+        return getattr(self, self.COLUMNS[column])
 
-        # Chromedriver options continued, set window size
-        self.driver.set_window_size(600, 600)
-        self.success_callback("SUCCESS: Driver initialised.")
-        
-        return self.driver
+    def __setitem__(self, column, value):
+        slot = self.COLUMNS[column]
+        if slot in self.INTERNED and isinstance(value, str):
+            value = sys.intern(value)
+        setattr(self, slot, value)
 
+    def get(self, column, default=None):
+        slot = self.COLUMNS.get(column)
+        return getattr(self, slot) if slot else default
 
-    def scrape_page(self):
-        # Get the HTML content of the page 
-        page_html = self.driver.page_source
+    def items(self):
+        return [(column, getattr(self, slot)) for column, slot in self.COLUMNS.items()]
 
-        # Parse the HTML content with BeautifulSoup
-        page = BeautifulSoup(page_html, "html.parser")
+    def as_dict(self):
+        return dict(self.items())
+
+
+# Initialise a record to hold the scraped data
+def empty_report():
+    return ReportRecord()
+
+
+# Clean text of any non-printing characters and extra spaces
+def clean_text(text):
+    return text.replace('\n', ' ').replace('\r', ' ').replace('\t', ' ').strip()
 
-        # Initialise a dictionary to hold the scraped data
-        data = {
-            "Title": None,
-            "Outlet": None,
-            "Date of publication": None,
-            "Article language(s)": None,
-            "Countries / regions discussed": None,
-            "Summary": None,
-            "Response": None
-        }
+
+# Publication date shown on a listing card
+CARD_DATE = re.compile(r"\b\d{2}\.\d{2}\.\d{4}\b")
+
+
+# Card metadata as returned by listing_items, the title is the card's title element if it has one
+def listing_item(href, title, text):
+    date = CARD_DATE.search(text)
+    return {"href": href, "title": clean_text(title) if title else None, "date": date.group(0) if date else None}
+
+
+# Page parsed once with BeautifulSoup ("html.parser" or "lxml" tree builder)
+class SoupPage:
+    def __init__(self, page_html, features="html.parser"):
+        from bs4 import BeautifulSoup
+        self.page = BeautifulSoup(page_html, features)
+
+    # Extract the report fields from a report page
+    def report(self):
+        page = self.page
+        data = empty_report()
 
         # Extract title and remove "Disinfo: " prefix 
         raw_title = page.find('title').get_text().strip()
@@ -145,8 +144,8 @@ class Scraper:
 
         # Extracting the RESPONSE
         response_section = page.find('div', class_='b-report__response')
+        response_texts = []  # Initialise an empty list to hold parts of the response text
         if response_section:
-            response_texts = []  # Initialise an empty list to hold parts of the response text
             for child in response_section.find('div', class_='b-text').children:
                 text = ''
                 if child.name == 'a':
@@ -160,8 +159,7 @@ class Scraper:
                     text = str(child)
                 
                 # Clean text of any non-printing characters and extra spaces
-                text_cleaned = text.replace('\n', ' ').replace('\r', ' ').replace('\t', ' ').strip()
-                response_texts.append(text_cleaned)
+                response_texts.append(clean_text(text))
 
         # Join the parts into a single string, ensuring spaces are correctly managed
         response_text = ' '.join(response_texts).replace('  ', ' ')
@@ -169,25 +167,1499 @@ class Scraper:
 
         return data
 
+    # Total items found from filter search ("b-archive__results-count")
+    def total_items(self):
+        cases_div = self.page.find("div", class_="b-archive__results-count")
+        if cases_div:
+            return int(cases_div.text.strip().split()[0])
+        return None
+
+    # Text of the last pagination link, None if there is no pagination
+    def last_pagination_item(self):
+        pagination_items = self.page.select('a.b-pagination__item')
+        if pagination_items:
+            return pagination_items[-1].get_text()
+        return None
+
+    # Report links on a listing page
+    def item_links(self):
+        return [item.get('href') for item in self.page.select("a.b-archive__database-item")]
+
+    # Link, title and date of every card on a listing page
+    def listing_items(self):
+        items = []
+        for card in self.page.select("a.b-archive__database-item"):
+            title = card.select_one("[class*='title']")
+            items.append(listing_item(card.get('href'), title.get_text(" ", strip=True) if title else None,
+                                      card.get_text(" ", strip=True)))
+        return items
+
+
+# Page parsed once with selectolax (lexbor), same extraction as SoupPage
+class SelectolaxPage:
+    def __init__(self, page_html):
+        from selectolax.lexbor import LexborHTMLParser
+        self.page = LexborHTMLParser(page_html)
+
+    # Extract the report fields from a report page
+    def report(self):
+        page = self.page
+        data = empty_report()
+
+        # Extract title and remove "Disinfo: " prefix 
+        raw_title = page.css_first('title').text().strip()
+        data["Title"] = raw_title.replace('Disinfo: ', '')
+
+        # Iterate through each list item in the details list 
+        for li in page.css('.b-report__details-list li'):
+            text = li.text().strip()
+            if "Outlet:" in text:
+                outlet_text = li.css_first('a').text().strip()
+                data["Outlet"] = outlet_text.replace("(opens in a new tab)", "").strip()
+            elif "Date of publication:" in text:
+                data["Date of publication"] = li.css_first('span').text().strip()
+            elif "Article language(s):" in text:
+                data["Article language(s)"] = li.css_first('span').text().strip()
+            elif "Countries / regions discussed:" in text:
+                data["Countries / regions discussed"] = li.css_first('span').text().strip()
+
+        # Extracting the SUMMARY
+        summary_section = page.css_first('div.b-report__summary')
+        if summary_section:
+            summary_text = summary_section.css_first('div.b-text').text(separator='', strip=True)
+            data["Summary"] = summary_text.replace('\n', ' ').replace('\r', ' ')
+
+        # Extracting the RESPONSE
+        response_section = page.css_first('div.b-report__response')
+        response_texts = []
+        if response_section:
+            for child in response_section.css_first('div.b-text').iter(include_text=True):
+                text = ''
+                if child.tag == 'a':
+                    text = ' ' + child.text()
+                elif child.tag == 'p':
+                    text = child.text()
+                elif child.tag == '-text':
+                    text = child.text()
+                response_texts.append(clean_text(text))
+
+        data["Response"] = ' '.join(response_texts).replace('  ', ' ')
+
+        return data
+
+    # Total items found from filter search ("b-archive__results-count")
+    def total_items(self):
+        cases_div = self.page.css_first("div.b-archive__results-count")
+        if cases_div:
+            return int(cases_div.text().strip().split()[0])
+        return None
+
+    # Text of the last pagination link, None if there is no pagination
+    def last_pagination_item(self):
+        pagination_items = self.page.css('a.b-pagination__item')
+        if pagination_items:
+            return pagination_items[-1].text()
+        return None
+
+    # Report links on a listing page
+    def item_links(self):
+        return [item.attributes.get('href') for item in self.page.css("a.b-archive__database-item")]
+
+    # Link, title and date of every card on a listing page
+    def listing_items(self):
+        items = []
+        for card in self.page.css("a.b-archive__database-item"):
+            title = card.css_first("[class*='title']")
+            items.append(listing_item(card.attributes.get('href'), title.text(separator=" ", strip=True) if title else None,
+                                      card.text(separator=" ", strip=True)))
+        return items
+
+
+# Available HTML parser backends
+PARSER_BACKENDS = ("html.parser", "lxml", "selectolax")
+
+
+# Parse a page once with the chosen backend, extractors then reuse the tree
+def parse_html(page_html, backend="html.parser"):
+    if backend == "selectolax":
+        return SelectolaxPage(page_html)
+    elif backend in ("html.parser", "lxml"):
+        return SoupPage(page_html, backend)
+    raise ValueError(f"Unknown parser backend: {backend}")
+
+
+# Fetch backend that loads report pages in the scraper's Chrome driver
+class BrowserFetcher:
+    def __init__(self, scraper):
+        self.scraper = scraper
+
+    def fetch(self, url):
+        # Navigate the driver and return the rendered HTML
+        self.scraper.navigate(url)
+        return self.scraper.current_html()
+
+    def close(self):
+        # Driver is owned by the scraper, nothing to release
+        pass
+
+
+# Requests the lean browser profile blocks through DevTools: images, fonts, stylesheets, media
+# and third-party trackers. Documents and the site's own scripts still load.
+LEAN_BLOCKED_URLS = ["*.png*", "*.jpg*", "*.jpeg*", "*.gif*", "*.webp*", "*.avif*", "*.svg*", "*.ico*",
+                     "*.woff*", "*.ttf*", "*.otf*", "*.eot*", "*.css*", "*.mp4*", "*.webm*", "*.mp3*",
+                     "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*", "*facebook.net*",
+                     "*connect.facebook.com*", "*hotjar.com*", "*youtube.com*", "*platform.twitter.com*"]
+
+# Bytes transferred for the current page and its resources, from the Navigation and Resource Timing APIs
+# Read once the load event has fired, so every profile is measured at the same point whatever its
+# page-load strategy. Cross-origin resources without Timing-Allow-Origin report 0, so this is a lower bound
+PAGE_TRANSFER_SCRIPT = """
+const done = arguments[arguments.length - 1];
+const total = () => performance.getEntriesByType('navigation').concat(performance.getEntriesByType('resource'))
+    .reduce((sum, entry) => sum + (entry.transferSize || 0), 0);
+if (document.readyState === 'complete') done(total());
+else window.addEventListener('load', () => done(total()));
+"""
+
+
+# Keep-alive connections per host, raised to the crawl's parallelism when it is larger
+HTTP_POOL_SIZE = 10
+
+
+# Fetch backend that loads report pages over plain HTTP
+# Report pages need no JavaScript, so a pooled keep-alive session is enough
+class HttpFetcher:
+    def __init__(self, pool_size=HTTP_POOL_SIZE, timeout=15, user_agent=None):
+        import requests
+        self.timeout = timeout
+        # Use cloudscraper when installed (handles Cloudflare), plain requests otherwise
+        # cloudscraper's user agent matches its TLS profile, so it is only replaced for plain requests
+        try:
+            import cloudscraper
+            self.session = cloudscraper.create_scraper()
+        except ImportError:
+            self.session = requests.Session()
+            if user_agent:
+                self.session.headers["User-Agent"] = user_agent
+        self.pool_size = None
+        self.resize(pool_size)
+
+    # Keep-alive connections kept per host, resized in place so cloudscraper's TLS adapter stays mounted
+    def resize(self, pool_size):
+        if pool_size == self.pool_size:
+            return
+        for adapter in set(self.session.adapters.values()):
+            adapter._pool_connections = adapter._pool_maxsize = pool_size # Read again when proxies are used
+            adapter.init_poolmanager(pool_size, pool_size, block=adapter._pool_block)
+        self.pool_size = pool_size
+
+    def fetch(self, url):
+        response = self.get(url)
+        response.raise_for_status()
+        return response.text
+
+    # Raw response, used for conditional requests by the cache
+    def get(self, url, headers=None):
+        return self.session.get(url, headers=headers, timeout=self.timeout)
+
+    def close(self):
+        self.session.close()
+
+
+# Browser user agent sent by the HTTP fetcher
+DEFAULT_USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36"
+
+
+# Default freshness window and size bound of the report page cache
+# Cached pages are revalidated on every use unless a freshness window is set
+CACHE_MAX_AGE = 0
+CACHE_MAX_BYTES = 512 * 1024 * 1024
+
+
+# Persistent cache of report page responses keyed by URL
+# Each entry is a body file and a JSON file with the URL, ETag, Last-Modified and fetch time
+class HttpCache:
+    def __init__(self, directory, max_age=CACHE_MAX_AGE, max_bytes=CACHE_MAX_BYTES):
+        self.directory = directory
+        self.max_age = max_age # Seconds an entry is used without revalidating
+        self.max_bytes = max_bytes # Least recently used entries are evicted above this size
+        self.lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+        self.total_bytes = sum(os.path.getsize(path) for path in self.body_paths())
+
+    def paths(self, url):
+        key = os.path.join(self.directory, hashlib.sha1(url.encode('utf-8')).hexdigest())
+        return key + ".html", key + ".json"
+
+    def body_paths(self):
+        return [os.path.join(self.directory, name) for name in os.listdir(self.directory) if name.endswith(".html")]
+
+    # Cached (body, metadata) for a URL, (None, None) on a miss
+    def get(self, url):
+        body_path, meta_path = self.paths(url)
+        try:
+            with open(meta_path, encoding='utf-8') as f:
+                meta = json.load(f)
+            with open(body_path, encoding='utf-8') as f:
+                body = f.read()
+        except (OSError, json.JSONDecodeError):
+            return None, None
+        os.utime(body_path) # Mark as recently used for eviction
+        return body, meta
+
+    def is_fresh(self, meta):
+        return time.time() - meta["fetched_at"] < self.max_age
+
+    def put(self, url, body, etag=None, last_modified=None):
+        body_path, meta_path = self.paths(url)
+        meta = {"url": url, "etag": etag, "last_modified": last_modified, "fetched_at": time.time()}
+        with self.lock:
+            if os.path.exists(body_path):
+                self.total_bytes -= os.path.getsize(body_path)
+            # Replaced whole, so a crash never leaves a truncated body under fresh metadata
+            self.write_file(body_path, body)
+            self.write_file(meta_path, json.dumps(meta))
+            self.total_bytes += os.path.getsize(body_path)
+            if self.total_bytes > self.max_bytes:
+                self.evict()
+
+    # Write to a temporary file first, readers see the old or the new file and nothing in between
+    def write_file(self, path, content):
+        temp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            f.write(content)
+        os.replace(temp_path, path)
+
+    # Entry confirmed unchanged by the server (304), restart its freshness window
+    def touch(self, url, meta):
+        meta["fetched_at"] = time.time()
+        self.write_file(self.paths(url)[1], json.dumps(meta))
+
+    # Remove least recently used entries until the cache is back under 90% of its bound
+    def evict(self):
+        for body_path in sorted(self.body_paths(), key=os.path.getmtime):
+            if self.total_bytes <= self.max_bytes * 0.9:
+                break
+            self.total_bytes -= os.path.getsize(body_path)
+            os.remove(body_path)
+            meta_path = body_path[:-len(".html")] + ".json"
+            if os.path.exists(meta_path):
+                os.remove(meta_path)
+
+    # Every cached (url, body), e.g. to re-run the parser without the network
+    def items(self):
+        for body_path in self.body_paths():
+            try:
+                with open(body_path[:-len(".html")] + ".json", encoding='utf-8') as f:
+                    url = json.load(f)["url"]
+                with open(body_path, encoding='utf-8') as f:
+                    yield url, f.read()
+            except (OSError, json.JSONDecodeError):
+                continue
+
+
+# HTTP fetch backend that serves report pages from the cache when possible
+# Fresh entries skip the network, stale ones are revalidated with ETag / Last-Modified
+class CachingFetcher:
+    def __init__(self, fetcher, cache):
+        self.fetcher = fetcher
+        self.cache = cache
+        self.hits = 0 # Served without a request
+        self.revalidated = 0 # Served after a 304 Not Modified
+        self.misses = 0 # Downloaded in full
+        self.modified = {} # Report URL -> last modified timestamp, from sitemap discovery
+
+    def fetch(self, url):
+        body, meta = self.cache.get(url)
+        headers = {}
+        if body is not None:
+            if self.cache.is_fresh(meta) or self.is_current(url, meta):
+                self.hits += 1
+                return body
+            if meta.get("etag"):
+                headers["If-None-Match"] = meta["etag"]
+            if meta.get("last_modified"):
+                headers["If-Modified-Since"] = meta["last_modified"]
+
+        response = self.fetcher.get(url, headers=headers)
+        if body is not None and response.status_code == 304:
+            self.cache.touch(url, meta)
+            self.revalidated += 1
+            return body
+
+        response.raise_for_status()
+        self.cache.put(url, response.text, response.headers.get("ETag"), response.headers.get("Last-Modified"))
+        self.misses += 1
+        return response.text
+
+    # A copy fetched after the page's listed last modification is still current
+    def is_current(self, url, meta):
+        modified = self.modified.get(url)
+        return modified is not None and meta["fetched_at"] > modified
+
+    def stats(self):
+        return f"Report cache: {self.hits} hits, {self.revalidated} revalidated, {self.misses} downloaded."
+
+    def close(self):
+        self.fetcher.close()
+
+
+# Sitemaps tried in turn: WordPress core, Yoast SEO, and the conventional location
+SITEMAP_PATHS = ("/wp-sitemap.xml", "/sitemap_index.xml", "/sitemap.xml")
+SITEMAP_NAMESPACE = "{http://www.sitemaps.org/schemas/sitemap/0.9}"
+
+# WordPress REST collection of reports, used when the site publishes no sitemap
+REST_REPORTS_PATH = "/wp-json/wp/v2/report"
+REST_PAGE_SIZE = 100 # Largest per_page WordPress allows
+
+# Path of a report page, other sitemap entries are ignored
+REPORT_URL_PATH = re.compile(r"/report/[^/]+/?$")
+
+
+# Sitemap <lastmod> or REST modified_gmt as an aware datetime, None if missing or malformed
+# Date-only values count from the end of that day, so a copy fetched that day is revalidated
+def parse_lastmod(text):
+    if not text:
+        return None
+    text = text.strip()
+    try:
+        if len(text) == 10:
+            day = datetime.datetime.strptime(text, "%Y-%m-%d")
+            return day.replace(tzinfo=datetime.timezone.utc) + datetime.timedelta(days=1)
+        modified = datetime.datetime.fromisoformat(text.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    # REST modified_gmt has no offset
+    return modified if modified.tzinfo else modified.replace(tzinfo=datetime.timezone.utc)
+
+
+# Lists report URLs from the site's XML sitemaps, or its WordPress REST API when there are none
+# A few bulk requests cover the whole archive, with last-modified times where the site gives them
+class SitemapDiscovery:
+    def __init__(self, fetch, site_url):
+        self.fetch = fetch # Body of a URL, raises on HTTP errors
+        self.site_url = site_url
+        self.requests = 0
+        self.source = None # Sitemap or REST endpoint the reports were listed from
+        self.failed_sitemaps = {} # Sitemaps of an index that could not be loaded -> error
+
+    def get(self, url):
+        self.requests += 1
+        return self.fetch(url)
+
+    # {report URL: last modified datetime or None}, in the site's order
+    def reports(self):
+        for path in SITEMAP_PATHS:
+            url = urljoin(self.site_url, path)
+            root = self.find_sitemap(url)
+            if root is None:
+                continue
+            reports = {}
+            self.read_sitemap(root, reports)
+            if reports:
+                self.source = url
+                return reports
+        return self.rest_reports()
+
+    # Parsed sitemap, None if the site has none there (missing, or an HTML page instead of XML)
+    def find_sitemap(self, url):
+        import xml.etree.ElementTree as ElementTree
+        try:
+            return ElementTree.fromstring(self.get(url))
+        except ElementTree.ParseError:
+            return None
+        except Exception as e:
+            if is_transient(e):
+                raise
+            return None
+
+    # Sitemap listed by an index, None if it fails to load or parse (the rest of the index is still read)
+    def load_child(self, url):
+        import xml.etree.ElementTree as ElementTree
+        try:
+            return ElementTree.fromstring(self.get(url))
+        except Exception as e:
+            self.failed_sitemaps[url] = str(e)
+            return None
+
+    # Collect the report entries of a sitemap, following a sitemap index into its sitemaps
+    def read_sitemap(self, root, reports):
+        if root.tag == SITEMAP_NAMESPACE + "sitemapindex":
+            sitemaps = [loc.text.strip() for loc in root.iter(SITEMAP_NAMESPACE + "loc") if loc.text]
+            # Only the report sitemaps when the index splits them by post type
+            report_sitemaps = [url for url in sitemaps if "report" in urlparse(url).path]
+            for url in report_sitemaps or sitemaps:
+                child = self.load_child(url)
+                if child is not None:
+                    self.read_sitemap(child, reports)
+        elif root.tag == SITEMAP_NAMESPACE + "urlset":
+            for entry in root.iter(SITEMAP_NAMESPACE + "url"):
+                url = (entry.findtext(SITEMAP_NAMESPACE + "loc") or "").strip()
+                if REPORT_URL_PATH.search(urlparse(url).path):
+                    reports[url] = parse_lastmod(entry.findtext(SITEMAP_NAMESPACE + "lastmod"))
+
+    # Report links from the WordPress REST API, REST_PAGE_SIZE per request
+    def rest_reports(self):
+        endpoint = urljoin(self.site_url, REST_REPORTS_PATH)
+        reports = {}
+        page_num = 1
+        while True:
+            try:
+                entries = json.loads(self.get(f"{endpoint}?per_page={REST_PAGE_SIZE}&page={page_num}&_fields=link,modified_gmt"))
+            except Exception as e:
+                if is_transient(e):
+                    raise
+                if page_num == 1:
+                    raise ValueError(f"No sitemap or REST endpoint lists the reports of {self.site_url}") from e
+                break # WordPress answers 400 past the last page
+            for entry in entries:
+                if entry.get("link"):
+                    reports[entry["link"]] = parse_lastmod(entry.get("modified_gmt"))
+            if len(entries) < REST_PAGE_SIZE:
+                break
+            page_num += 1
+        self.source = endpoint
+        return reports
+
+
+# HTTP statuses worth retrying: timeouts, rate limiting and server errors
+TRANSIENT_STATUSES = {408, 425, 429, 500, 502, 503, 504}
+
+
+# HTTP statuses that mean the site wants us to slow down
+THROTTLE_STATUSES = {429, 503}
+
+# Markers of a Cloudflare challenge served in place of the requested page
+CHALLENGE_MARKERS = ("<title>Just a moment...</title>", "Attention Required! | Cloudflare", 'id="challenge-form"')
+
+
+# Raised when a challenge page is served instead of the requested page
+class ChallengePageError(Exception):
+    def __init__(self, url):
+        super().__init__(f"Challenge page served for {url}")
+
+
+def is_challenge_page(page_html):
+    return any(marker in page_html for marker in CHALLENGE_MARKERS)
+
+
+# Whether a failed fetch may succeed if retried
+# HTTP errors are transient for TRANSIENT_STATUSES only, network errors, browser
+# timeouts and challenge pages are always transient, a closed browser window and parse errors are not
+def is_transient(error):
+    if isinstance(error, ChallengePageError):
+        return True
+    if isinstance(error, (NoSuchWindowException, InvalidSessionIdException)):
+        return False # The browser session is gone, retrying it cannot help
+    if isinstance(error, WebDriverException): # Includes TimeoutException
+        return True
+    status = getattr(getattr(error, "response", None), "status_code", None)
+    if status is not None:
+        return status in TRANSIENT_STATUSES
+    return isinstance(error, OSError) # Connection errors, including requests' RequestException
+
+
+# Whether a failure means the site is overloaded or pushing back: timeouts, 429/503 and challenge pages
+def is_throttling(error):
+    if isinstance(error, (ChallengePageError, TimeoutException, TimeoutError)):
+        return True
+    status = getattr(getattr(error, "response", None), "status_code", None)
+    if status is not None:
+        return status in THROTTLE_STATUSES
+    import requests
+    return isinstance(error, requests.Timeout)
+
+
+# AIMD controller for the request rate and the number of requests in flight
+# Healthy responses raise the concurrency limit by 1/limit (about one per round of requests)
+# and shrink the gap between request starts; throttling halves the limit and doubles the gap,
+# responses much slower than the fastest seen cut the limit by a quarter.
+# Decreases happen at most once per response time, so one burst of errors counts once.
+# After throttling the limit holds for a few seconds, then grows slowly near the limit
+# where the site last pushed back.
+class RateController:
+    RATE_WINDOW = 10 # Seconds of completions used for the request rate
+
+    def __init__(self, max_concurrency=8, min_concurrency=1, slow_latency=0.5, latency_factor=3.0, max_interval=2.0, hold=3.0):
+        self.max_concurrency = max_concurrency
+        self.min_concurrency = min_concurrency
+        self.slow_latency = slow_latency # Responses faster than this are never treated as slow
+        self.latency_factor = latency_factor # Slow: this many times the fastest response seen
+        self.max_interval = max_interval # Longest gap between request starts after backing off
+        self.hold = hold # Seconds without growth after throttling
+        self.enabled = True # When False requests only pass through for the statistics
+        self.limit = float(min(2, max_concurrency))
+        self.ceiling = None # Limit at the last throttling response
+        self.interval = 0.0 # Seconds between request starts
+        self.in_flight = 0
+        self.next_start = 0.0
+        self.last_decrease = 0.0
+        self.base_latency = None # Fastest recent response
+        self.completions = deque() # Completion times in the last RATE_WINDOW seconds
+        self.backoffs = 0
+        self.condition = threading.Condition()
+
+    # Change the ceiling, e.g. to the crawl's worker count
+    def set_max_concurrency(self, max_concurrency):
+        with self.condition:
+            self.max_concurrency = max(max_concurrency, self.min_concurrency)
+            self.limit = min(self.limit, self.max_concurrency)
+            self.condition.notify_all()
+
+    # Wait for a free slot and the gap since the previous request start
+    def acquire(self):
+        with self.condition:
+            while self.enabled:
+                now = time.monotonic()
+                if self.in_flight < max(int(self.limit), self.min_concurrency):
+                    wait = self.next_start - now
+                    if wait <= 0:
+                        break
+                    self.condition.wait(wait)
+                else:
+                    self.condition.wait()
+            self.in_flight += 1
+            self.next_start = time.monotonic() + self.interval
+
+    def release(self, latency, throttled=False):
+        with self.condition:
+            self.in_flight -= 1
+            now = time.monotonic()
+            self.completions.append(now)
+            while self.completions and self.completions[0] < now - self.RATE_WINDOW:
+                self.completions.popleft()
+
+            can_decrease = now - self.last_decrease > latency
+            if throttled:
+                if can_decrease:
+                    self.ceiling = self.limit
+                    self.limit = max(self.min_concurrency, self.limit / 2)
+                    self.interval = min(self.max_interval, max(self.interval * 2, 0.05))
+                    self.last_decrease = now
+                    self.backoffs += 1
+            else:
+                # The fastest response drifts up slowly so a faster period doesn't pin it forever
+                if self.base_latency is None or latency < self.base_latency:
+                    self.base_latency = latency
+                else:
+                    self.base_latency += (latency - self.base_latency) * 0.01
+                if latency > max(self.slow_latency, self.base_latency * self.latency_factor):
+                    if can_decrease:
+                        self.limit = max(self.min_concurrency, self.limit * 0.75)
+                        self.last_decrease = now
+                else:
+                    if now - self.last_decrease > self.hold or not self.ceiling:
+                        step = 1 / self.limit
+                        if self.ceiling and self.limit + 1 > self.ceiling:
+                            step /= self.limit # Probe slowly around the last throttling point
+                        self.limit = min(self.max_concurrency, self.limit + step)
+                    self.interval = self.interval / 2 if self.interval > 0.01 else 0.0
+            self.condition.notify_all()
+
+    # Hold a slot for one request, the outcome feeds the controller
+    @contextlib.contextmanager
+    def slot(self):
+        self.acquire()
+        start = time.perf_counter()
+        throttled = False
+        try:
+            yield
+        except Exception as e:
+            throttled = is_throttling(e)
+            raise
+        finally:
+            self.release(time.perf_counter() - start, throttled)
+
+    def requests_per_second(self):
+        with self.condition:
+            if len(self.completions) < 2:
+                return 0.0
+            return len(self.completions) / max(time.monotonic() - self.completions[0], 1e-3)
+
+    # Current limits for the progress callbacks
+    def status(self):
+        return {"concurrency": max(int(self.limit), self.min_concurrency) if self.enabled else self.max_concurrency,
+                "interval": round(self.interval, 2),
+                "requests_per_second": round(self.requests_per_second(), 1)}
+
+
+# Retries transient failures with exponential backoff and full jitter
+# Attempt n waits a random time up to min(max_delay, base_delay * 2 ** n)
+class RetryPolicy:
+    def __init__(self, attempts=4, base_delay=1.0, max_delay=30.0):
+        self.attempts = attempts # Total tries, including the first
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+    def delay(self, attempt):
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+
+    # Call func until it succeeds, raising fatal errors and the last transient error
+    # on_retry(error, attempt, delay) is told about every retry, cancelled() stops retrying
+    def call(self, func, *args, on_retry=None, cancelled=None):
+        for attempt in range(self.attempts):
+            try:
+                return func(*args)
+            except Exception as e:
+                if not is_transient(e) or attempt + 1 >= self.attempts or (cancelled and cancelled()):
+                    raise
+                delay = self.delay(attempt)
+                if on_retry:
+                    on_retry(e, attempt + 1, delay)
+                time.sleep(delay)
+
+
+# Database listing of all disinformation cases
+BASE_URL = "https://euvsdisinfo.eu/disinformation-cases"
+
+# Listing page size and the deepest listing page that is safe to request
+# The site breaks at large page numbers, so shards are kept under this depth
+ITEMS_PER_PAGE = 60
+SAFE_PAGE_DEPTH = 50
+
+# First day of the EUvsDisinfo database, used when sharding without a date filter
+ARCHIVE_START = datetime.date(2015, 1, 1)
+DATE_FORMAT = "%d.%m.%Y"
+
+
+# Columns written for every report, rows are keyed by report URL
+REPORT_FIELDS = ["Title", "Outlet", "Date of publication", "Article language(s)",
+                 "Countries / regions discussed", "Summary", "Response", "URL"]
+
+# Columns written in index mode, as shown on each listing card
+INDEX_FIELDS = ["Title", "Date of publication", "URL"]
+
+
+# CSV output that appends each row as soon as it is scraped
+# Duplicates are dropped incrementally by key instead of re-reading the file at the end
+class CsvSink:
+    def __init__(self, filename, fieldnames=REPORT_FIELDS, key_field="URL"):
+        self.filename = filename
+        self.fieldnames = fieldnames
+        self.key_field = key_field
+        self.keys = set() # Keys already written
+        self.output_file = None # Opened on the first row, so empty runs create no file
+        self.rows_written = 0
+        self.duplicates_skipped = 0
+
+    def open(self):
+        # Append to an existing file without repeating the header or BOM
+        if os.path.exists(self.filename) and os.path.getsize(self.filename) > 0:
+            # Older files have other columns (e.g. no URL), rows follow the file's header so they line up
+            header = self.read_header()
+            if header:
+                self.fieldnames = header
+            self.keys.update(self.read_keys())
+            self.output_file = open(self.filename, 'a', newline='', encoding='utf-8')
+            self.writer = csv.DictWriter(self.output_file, self.fieldnames, extrasaction='ignore')
+        else:
+            self.output_file = open(self.filename, 'w', newline='', encoding='utf-8-sig')
+            self.writer = csv.DictWriter(self.output_file, self.fieldnames, extrasaction='ignore')
+            self.writer.writeheader()
+
+    def read_header(self):
+        with open(self.filename, newline='', encoding='utf-8-sig') as f:
+            return next(csv.reader(f), None)
+
+    # Keys of rows already in the file
+    def read_keys(self):
+        with open(self.filename, newline='', encoding='utf-8-sig') as f:
+            return {self.row_key(row) for row in csv.DictReader(f)}
+
+    def row_key(self, row):
+        key = row.get(self.key_field)
+        return key if key else tuple(row.get(field) for field in self.fieldnames)
+
+    # Write a row unless its key was already written, returns True if written
+    def write(self, row):
+        if self.output_file is None:
+            self.open()
+        key = self.row_key(row)
+        if key in self.keys:
+            self.duplicates_skipped += 1
+            return False
+        self.writer.writerow(row)
+        self.output_file.flush() # Row is on disk even if the process dies
+        self.keys.add(key)
+        self.rows_written += 1
+        return True
+
+    def close(self):
+        if self.output_file:
+            self.output_file.close()
+            self.output_file = None
+
+
+# Append-only journal of crawl state, used to resume a killed or crashed run
+# Each line is a JSON record: run settings, the page being crawled, or a committed item
+class CrawlJournal:
+    def __init__(self, filename, mode='w'):
+        self.filename = filename
+        self.mode = mode # 'w' starts a new journal, 'a' continues a resumed one
+        self.journal_file = None
+        self.last_state = None
+
+    def write(self, record):
+        if self.journal_file is None:
+            self.journal_file = open(self.filename, self.mode, encoding='utf-8')
+        self.journal_file.write(json.dumps(record) + "\n")
+        self.journal_file.flush()
+
+    # Settings needed to rebuild the same crawl
+    def start(self, settings):
+        self.write({"type": "start", **settings})
+
+    # An item whose row is already in the output
+    def item(self, url):
+        self.write({"type": "item", "url": url})
+
+    # Page and sort order about to be crawled, only written when it changes
+    def page(self, state):
+        if state != self.last_state:
+            self.write({"type": "page", **state})
+            os.fsync(self.journal_file.fileno())
+            self.last_state = state
+
+    # A report or listing page left in the dead-letter queue
+    def failed(self, url, kind, error):
+        self.write({"type": "failed", "url": url, "kind": kind, "error": error})
+
+    # A dead-lettered URL that succeeded on retry
+    def recovered(self, url):
+        self.write({"type": "recovered", "url": url})
+
+    # A date shard whose items are all committed
+    def shard_done(self, shard):
+        self.write({"type": "shard", "start": shard[0], "end": shard[1]})
+        os.fsync(self.journal_file.fileno())
+
+    def close(self):
+        if self.journal_file:
+            self.journal_file.close()
+            self.journal_file = None
+
+    # Replay a journal into (settings, last page state, committed URLs, URLs committed on that page, finished shards,
+    # dead-lettered URL -> (kind, last error))
+    @staticmethod
+    def load(filename):
+        settings, state, urls, page_urls, shards, failed = {}, None, [], set(), set(), {}
+        with open(filename, encoding='utf-8') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    break # Line cut short by a crash, everything before it is committed
+                record_type = record.pop("type")
+                if record_type == "start":
+                    settings = record
+                elif record_type == "page":
+                    state = record
+                    page_urls = set()
+                elif record_type == "item":
+                    urls.append(record["url"])
+                    page_urls.add(record["url"])
+                elif record_type == "shard":
+                    shards.add((record["start"], record["end"]))
+                elif record_type == "failed":
+                    failed[record["url"]] = (record["kind"], record["error"])
+                elif record_type == "recovered":
+                    failed.pop(record["url"], None)
+        return settings, state, urls, page_urls, shards, failed
+
+
+# Parse a "Date of publication" value (dd.mm.yyyy), None if missing or malformed
+def parse_publication_date(text):
+    try:
+        return datetime.datetime.strptime(text.strip(), "%d.%m.%Y")
+    except (AttributeError, ValueError):
+        return None
+
+
+# Split a comma-joined field ("Russian, English") into a list
+def split_list_field(text):
+    if not text:
+        return []
+    return [value.strip() for value in text.split(',') if value.strip()]
+
+
+# Typed schema for Parquet output: real dates, list columns and dictionary-encoded outlets
+def report_schema():
+    import pyarrow as pa
+    return pa.schema([
+        ("Title", pa.string()),
+        ("Outlet", pa.dictionary(pa.int32(), pa.string())),
+        ("Date of publication", pa.date32()),
+        ("Article language(s)", pa.list_(pa.string())),
+        ("Countries / regions discussed", pa.list_(pa.string())),
+        ("Summary", pa.string()),
+        ("Response", pa.string()),
+        ("URL", pa.string())
+    ])
+
+
+# Convert a batch of CSV rows into a typed Arrow table
+def report_table(rows, schema):
+    import pyarrow as pa
+    dates = [parse_publication_date(row.get("Date of publication")) for row in rows]
+    columns = {
+        "Title": pa.array([row.get("Title") for row in rows], pa.string()),
+        "Outlet": pa.array([row.get("Outlet") or None for row in rows], pa.string()).dictionary_encode(),
+        "Date of publication": pa.array([date.date() if date else None for date in dates], pa.date32()),
+        "Article language(s)": pa.array([split_list_field(row.get("Article language(s)")) for row in rows], pa.list_(pa.string())),
+        "Countries / regions discussed": pa.array([split_list_field(row.get("Countries / regions discussed")) for row in rows], pa.list_(pa.string())),
+        "Summary": pa.array([row.get("Summary") for row in rows], pa.string()),
+        "Response": pa.array([row.get("Response") for row in rows], pa.string()),
+        "URL": pa.array([row.get("URL") or None for row in rows], pa.string())
+    }
+    return pa.Table.from_pydict(columns, schema=schema)
+
+
+# Write a scraped CSV out as Parquet, one row group per batch so memory stays flat
+def csv_to_parquet(csv_filename, parquet_filename=None, batch_size=10000):
+    import pyarrow.parquet as pq
+    parquet_filename = parquet_filename or os.path.splitext(csv_filename)[0] + ".parquet"
+    schema = report_schema()
+    with open(csv_filename, newline='', encoding='utf-8-sig') as f, pq.ParquetWriter(parquet_filename, schema) as writer:
+        batch = []
+        for row in csv.DictReader(f):
+            batch.append(row)
+            if len(batch) >= batch_size:
+                writer.write_table(report_table(batch, schema))
+                batch = []
+        if batch:
+            writer.write_table(report_table(batch, schema))
+    return parquet_filename
+
+
+# SQLite database of every report ever scraped, one row per report URL
+# Rows are upserted in batched transactions while the crawl runs
+class SqliteStore:
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS reports (
+            url TEXT PRIMARY KEY,
+            title TEXT,
+            outlet TEXT,
+            publication_date TEXT,
+            languages TEXT,
+            countries TEXT,
+            summary TEXT,
+            response TEXT,
+            scraped_at TEXT
+        );
+        CREATE TABLE IF NOT EXISTS report_languages (
+            url TEXT REFERENCES reports(url) ON DELETE CASCADE,
+            language TEXT,
+            PRIMARY KEY (url, language)
+        );
+        CREATE TABLE IF NOT EXISTS report_countries (
+            url TEXT REFERENCES reports(url) ON DELETE CASCADE,
+            country TEXT,
+            PRIMARY KEY (url, country)
+        );
+        CREATE INDEX IF NOT EXISTS idx_reports_publication_date ON reports(publication_date);
+        CREATE INDEX IF NOT EXISTS idx_reports_outlet ON reports(outlet);
+        CREATE INDEX IF NOT EXISTS idx_report_languages_language ON report_languages(language);
+        CREATE INDEX IF NOT EXISTS idx_report_countries_country ON report_countries(country);
+    """
+
+    UPSERT = """
+        INSERT INTO reports (url, title, outlet, publication_date, languages, countries, summary, response, scraped_at)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ON CONFLICT(url) DO UPDATE SET
+            title = excluded.title,
+            outlet = excluded.outlet,
+            publication_date = excluded.publication_date,
+            languages = excluded.languages,
+            countries = excluded.countries,
+            summary = excluded.summary,
+            response = excluded.response,
+            scraped_at = excluded.scraped_at
+    """
+
+    def __init__(self, filename, batch_size=100):
+        self.filename = filename
+        self.batch_size = batch_size
+        self.batch = [] # Rows waiting for the next transaction
+        self.rows_written = 0
+        # Rows are written from worker threads, the scraper serialises access
+        self.connection = sqlite3.connect(filename, check_same_thread=False)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.executescript(self.SCHEMA)
+
+    # Queue a row, committing a transaction once the batch is full
+    def upsert(self, row):
+        if not row.get("URL"):
+            return
+        self.batch.append(row)
+        if len(self.batch) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        if not self.batch:
+            return
+        scraped_at = datetime.datetime.now().isoformat(timespec='seconds')
+        with self.connection:
+            for row in self.batch:
+                url = row["URL"]
+                publication_date = parse_publication_date(row.get("Date of publication"))
+                languages = split_list_field(row.get("Article language(s)"))
+                countries = split_list_field(row.get("Countries / regions discussed"))
+                self.connection.execute(self.UPSERT, (
+                    url, row.get("Title"), row.get("Outlet"),
+                    publication_date.date().isoformat() if publication_date else None,
+                    row.get("Article language(s)"), row.get("Countries / regions discussed"),
+                    row.get("Summary"), row.get("Response"), scraped_at))
+                # Replace the report's language and country rows
+                self.connection.execute("DELETE FROM report_languages WHERE url = ?", (url,))
+                self.connection.execute("DELETE FROM report_countries WHERE url = ?", (url,))
+                self.connection.executemany("INSERT OR IGNORE INTO report_languages VALUES (?, ?)", [(url, language) for language in languages])
+                self.connection.executemany("INSERT OR IGNORE INTO report_countries VALUES (?, ?)", [(url, country) for country in countries])
+        self.rows_written += len(self.batch)
+        self.batch = []
+
+    # Upsert every row of a scraped CSV (e.g. rows not yet flushed when a run crashed)
+    def import_csv(self, csv_filename):
+        with open(csv_filename, newline='', encoding='utf-8-sig') as f:
+            for row in csv.DictReader(f):
+                self.upsert(row)
+        self.flush()
+
+    def close(self):
+        self.flush()
+        self.connection.close()
+
+
+# Output formats, Parquet is written from the streamed CSV when the run ends
+OUTPUT_FORMATS = ("csv", "parquet")
+
+
+# Journal file kept next to the output file
+def journal_filename(output_filename):
+    return os.path.splitext(output_filename)[0] + ".journal"
+
+
+# Dead-letter file of URLs that still failed after the final retry
+def failed_filename(output_filename):
+    return os.path.splitext(output_filename)[0] + ".failed.csv"
+
+
+# Available fetch backends for report pages
+FETCH_MODES = ("browser", "http")
+
+
+# How report URLs are found: paginating the listing pages, or the site's sitemaps
+DISCOVERY_MODES = ("listing", "sitemap")
+
+
+# Latency histogram bucket bounds in seconds
+METRIC_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+
+
+# Thread safe counters and per-phase latency histograms of a crawl
+# Phases: listing (whole listing page load), discovery (sitemap or REST page), wait
+# (wait_for_elements), report_fetch (report page HTML), page_source (driver transfer), parse (HTML parse) and save
+# Phases can nest, e.g. a browser report_fetch includes its page_source transfer
+class CrawlMetrics:
+    def __init__(self, buckets=METRIC_BUCKETS):
+        self.buckets = buckets
+        self.lock = threading.Lock()
+        self.counters = {}
+        self.histograms = {} # Phase -> {"counts": per bucket (last is +Inf), "count", "sum"}
+
+    def count(self, name, amount=1):
+        with self.lock:
+            self.counters[name] = self.counters.get(name, 0) + amount
+
+    def observe(self, phase, seconds):
+        with self.lock:
+            histogram = self.histograms.get(phase)
+            if histogram is None:
+                histogram = self.histograms[phase] = {"counts": [0] * (len(self.buckets) + 1), "count": 0, "sum": 0.0}
+            index = next((i for i, bound in enumerate(self.buckets) if seconds <= bound), len(self.buckets))
+            histogram["counts"][index] += 1
+            histogram["count"] += 1
+            histogram["sum"] += seconds
+
+    # Time the enclosed block as one observation of a phase
+    @contextlib.contextmanager
+    def time(self, phase):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(phase, time.perf_counter() - start)
+
+    # Copy of every counter and histogram, bucket counts are cumulative
+    def snapshot(self):
+        with self.lock:
+            phases = {}
+            for phase, histogram in self.histograms.items():
+                cumulative, buckets = 0, {}
+                for bound, count in zip(list(self.buckets) + ["+Inf"], histogram["counts"]):
+                    cumulative += count
+                    buckets[str(bound)] = cumulative
+                phases[phase] = {"count": histogram["count"], "sum": histogram["sum"],
+                                 "mean": histogram["sum"] / histogram["count"], "buckets": buckets}
+            return {"time": datetime.datetime.now().isoformat(timespec='seconds'),
+                    "counters": dict(self.counters), "phases": phases}
+
+    # Prometheus text exposition format
+    def prometheus_text(self):
+        snapshot = self.snapshot()
+        lines = []
+        for name, value in sorted(snapshot["counters"].items()):
+            lines.append(f"# TYPE euvsdisinfo_{name}_total counter")
+            lines.append(f"euvsdisinfo_{name}_total {value}")
+        lines.append("# TYPE euvsdisinfo_phase_seconds histogram")
+        for phase, histogram in sorted(snapshot["phases"].items()):
+            for bound, count in histogram["buckets"].items():
+                lines.append(f'euvsdisinfo_phase_seconds_bucket{{phase="{phase}",le="{bound}"}} {count}')
+            lines.append(f'euvsdisinfo_phase_seconds_sum{{phase="{phase}"}} {histogram["sum"]:.6f}')
+            lines.append(f'euvsdisinfo_phase_seconds_count{{phase="{phase}"}} {histogram["count"]}')
+        return "\n".join(lines) + "\n"
+
+    # Write the metrics to a file, Prometheus text for .prom files and JSON otherwise
+    # Written to a temporary file first so readers never see a partial export
+    def export(self, filename):
+        if filename.endswith(".prom"):
+            content = self.prometheus_text()
+        else:
+            content = json.dumps(self.snapshot(), indent=2)
+        temp_filename = filename + ".tmp"
+        with open(temp_filename, 'w', encoding='utf-8') as f:
+            f.write(content)
+        os.replace(temp_filename, filename)
+
+    # Bytes and load time per browser page, None if the browser loaded no pages
+    def browser_summary(self):
+        snapshot = self.snapshot()
+        pages = snapshot["counters"].get("browser_pages")
+        if not pages:
+            return None
+        loads = [snapshot["phases"][phase] for phase in ("listing", "report_fetch") if phase in snapshot["phases"]]
+        load_time = sum(h["sum"] for h in loads) / max(sum(h["count"] for h in loads), 1)
+        return (f"Browser transfer: {pages} pages, {snapshot['counters'].get('browser_bytes', 0) / pages / 1024:.1f} KiB "
+                f"and {load_time * 1000:.0f} ms load per page")
+
+    # One line per phase for the log, slowest total time first
+    def summary(self):
+        phases = self.snapshot()["phases"]
+        return [f"{phase}: {h['count']} x {h['mean'] * 1000:.1f} ms mean, {h['sum']:.1f} s total"
+                for phase, h in sorted(phases.items(), key=lambda item: -item[1]["sum"])]
+
+
+# Exports metrics to a file at a fixed interval while a crawl runs
+class MetricsExporter(Thread):
+    def __init__(self, metrics, filename, interval=10):
+        super().__init__(daemon=True)
+        self.metrics = metrics
+        self.filename = filename
+        self.interval = interval
+        self.stopped = threading.Event()
+
+    def run(self):
+        while not self.stopped.wait(self.interval):
+            self.metrics.export(self.filename)
+
+    # Stop exporting and write the final metrics
+    def stop(self):
+        self.stopped.set()
+        self.join()
+        self.metrics.export(self.filename)
+
+
+# Crawls report pages with bounded concurrency on an asyncio loop
+# Blocking fetches and parses run on a worker pool, so any thread safe fetcher works
+class AsyncCrawler:
+    def __init__(self, scraper, concurrency=8, per_host_limit=None):
+        self.scraper = scraper
+        self.concurrency = concurrency # Max reports in flight overall
+        self.per_host_limit = per_host_limit or concurrency # Max reports in flight per host (politeness)
+
+    # Crawl a list of report URLs and return the rows in URL order
+    def run(self, urls):
+        import asyncio # Only loaded for concurrent crawls
+        return asyncio.run(self.crawl(urls))
+
+    async def crawl(self, urls):
+        import asyncio
+        self.global_limit = asyncio.Semaphore(self.concurrency)
+        self.host_limits = {}
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            self.executor = executor
+            return await asyncio.gather(*(self.crawl_item(url) for url in urls))
+
+    # Semaphore limiting requests to a single host
+    def host_limit(self, url):
+        import asyncio
+        host = urlparse(url).netloc
+        if host not in self.host_limits:
+            self.host_limits[host] = asyncio.Semaphore(self.per_host_limit)
+        return self.host_limits[host]
+
+    async def crawl_item(self, url):
+        import asyncio
+        scraper = self.scraper
+        loop = asyncio.get_running_loop()
+        async with self.global_limit, self.host_limit(url):
+            # Respect pause, kill and item limit before starting a request
+            await loop.run_in_executor(self.executor, scraper.pause_event.wait)
+            if not scraper.check_if_scraping() or scraper.item_limit_reached():
+                return None
+
+            scraper.output_callback(f"Processing: {url}")
+            try:
+                page_html = await loop.run_in_executor(self.executor, scraper.fetch_report, url)
+                data = await loop.run_in_executor(self.executor, scraper.scrape_page, page_html)
+                if scraper.item_limit_reached():
+                    return None
+                scraper.record_item(url, data)
+                return data
+            except Exception as e:
+                scraper.item_failed(url, e)
+                return None
+            finally:
+                scraper.report_progress()
+
+
+# Pool of Chrome drivers that scrape report pages from a shared queue
+# Used when a real browser is required (e.g. Cloudflare blocks plain HTTP)
+class DriverPool:
+    def __init__(self, scraper, workers=2, max_restarts=3):
+        self.scraper = scraper
+        self.workers = workers
+        self.max_restarts = max_restarts # Consecutive restarts allowed per worker (and per URL) before giving up
+        self.drivers = [None] * workers # Drivers are kept alive between listing pages
+        self.lock = threading.Lock()
+
+    # Scrape a list of report URLs across all workers
+    def run(self, urls):
+        self.queue = queue.Queue()
+        for url in urls:
+            self.queue.put(url)
+        self.pending = len(urls) # URLs not yet scraped or failed
+        self.requeues = {} # URL -> times it was put back after losing a driver session
+
+        threads = [Thread(target=self.worker, args=(i,), daemon=True) for i in range(self.workers)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # Queue anything left for the final retry (or the dead-letter file of a killed run)
+        left = []
+        while not self.queue.empty():
+            left.append(self.queue.get())
+        if left and not self.scraper.item_limit_reached():
+            reason = "driver failures" if self.scraper.scraping else "crawl stopped"
+            self.scraper.warning_callback(f"WARNING: {len(left)} items left unscraped after {reason}.")
+            for url in left:
+                self.scraper.item_failed(url, reason, log=False)
+
+    def worker(self, worker_id):
+        scraper = self.scraper
+        restarts = 0
+        while self.pending > 0:
+            scraper.pause_event.wait()  # Pause here if pause_event is cleared, pausing also clears scraping
+            if not scraper.check_if_scraping() or scraper.item_limit_reached():
+                break
+            try:
+                url = self.queue.get(timeout=0.5)
+            except queue.Empty:
+                continue # Other workers may still requeue items
+
+            scraper.output_callback(f"Processing: {url}")
+            try:
+                # Timeouts and challenge pages are retried with backoff like any other fetch
+                page_html = scraper.with_retry(self.fetch_page, worker_id, url)
+            except (NoSuchWindowException, InvalidSessionIdException) as e:
+                # Browser session lost, put the URL back and restart this worker's driver
+                self.restart_driver(worker_id)
+                self.requeues[url] = self.requeues.get(url, 0) + 1
+                if self.requeues[url] > self.max_restarts:
+                    scraper.item_failed(url, e)
+                    with self.lock:
+                        self.pending -= 1
+                else:
+                    self.queue.put(url)
+                restarts += 1
+                if restarts > self.max_restarts:
+                    scraper.error_callback(f"ERROR: Driver {worker_id} failed {restarts} times, stopping worker: {e}")
+                    break
+                scraper.warning_callback(f"WARNING: Driver {worker_id} lost its browser session, restarting: {e}")
+                continue
+            except Exception as e:
+                scraper.item_failed(url, e)
+                with self.lock:
+                    self.pending -= 1
+                continue
+            restarts = 0
+
+            try:
+                data = scraper.scrape_page(page_html)
+                if not scraper.item_limit_reached():
+                    scraper.record_item(url, data)
+            except Exception as e:
+                scraper.item_failed(url, e)
+            finally:
+                with self.lock:
+                    self.pending -= 1
+                scraper.report_progress()
+
+    # Load a report page in this worker's driver, starting one if needed
+    def fetch_page(self, worker_id, url):
+        scraper = self.scraper
+        if self.drivers[worker_id] is None:
+            self.drivers[worker_id] = scraper.create_driver()
+        driver = self.drivers[worker_id]
+        with scraper.rate_controller.slot():
+            with scraper.metrics.time("report_fetch"):
+                driver.get(url)
+                with scraper.metrics.time("page_source"):
+                    page_html = driver.page_source
+            scraper.check_challenge(url, page_html)
+        scraper.metrics.count("report_pages")
+        scraper.count_transfer(driver)
+        return page_html
+
+    # Quit a crashed driver so the next item starts a fresh one
+    def restart_driver(self, worker_id):
+        driver = self.drivers[worker_id]
+        self.drivers[worker_id] = None
+        if driver:
+            try:
+                driver.quit()
+            except Exception:
+                pass
+
+    def close(self):
+        for worker_id in range(self.workers):
+            self.restart_driver(worker_id)
+
+
+# Default for callbacks that were not given
+def ignore_callback(*args, **kwargs):
+    pass
+
+
+# Scraper logic and initialisation 
+class Scraper:
+    def __init__(self, base_url, update_callback = None, output_callback = None, 
+    warning_callback = None, error_callback = None, success_callback = None,
+    fetch_mode = "browser", cache_dir = None, headless = False, lean_browser = False,
+    cache_max_age = CACHE_MAX_AGE, cache_max_bytes = CACHE_MAX_BYTES):
+        # Initialise URL
+        self.base_url = base_url
+        # Initialise scraping states
+        self.scraping = False # For when scraper is currently running
+        self.fatal_error = None # Error that ended the crawl early, None if it ran to completion
+        self.pause_event = threading.Event() # For pausing scrape
+        self.output_filename = None # Output file, timestamped when not set
+        self.sink = None # Streaming output for scraped rows
+        self.output_format = "csv" # Also write a typed Parquet file when "parquet"
+        self.database = None # SQLite database to upsert rows into, None to disable
+        self.store = None # SqliteStore for the database
+        self.journal = None # Crawl state journal for resuming
+        self.resume_urls = set() # Items of the resumed page scraped before the run stopped
+        self.delta_mode = False # Only scrape reports newer than an existing dataset
+        self.index_only = False # Record the listing cards (title, date, URL) without visiting report pages
+        self.discovery = "listing" # Find reports on the listing pages or in the site's sitemaps
+        self.modified_since = None # Sitemap discovery skips reports last modified before this date
+        self.known_urls = set() # Report URLs already in the existing dataset
+        self.delta_since = None # Newest publication date in a dataset without URLs
+        self.delta_dataset = None # Dataset a delta scrape extends, reloaded on resume
+        self.sharded = False # Crawl date shards instead of flipping the sort order halfway
+        self.shard_workers = 4 # Shards crawled at once (http mode only)
+        self.done_shards = set() # Shards finished before a resume
+        self.sort_order = "desc"  # Start with descending order
+        self.page_num = 1 # Starting page number
+        self.halfway_reached = False  # Flag to indicate if page has reached halfway
+        self.pages_scraped = 0  # Track number of pages scraped
+        self.items_scraped = 0 # Track items scraped
+        self.max_items = None # User can set max items to scrape 
+        self.total_items = 0 # Find the total number of items for progress bar
+        self.scraped_urls = set() # Track scraped urls to avoid scraping the same pages
+        self.total_items_fetched = False # Check to see if total_items are fetched
+        self.pagination_fetched = False # Check to see if half page has been fetched
+        self.concurrency = 1 # Report pages fetched at once (http mode only)
+        self.per_host_limit = None # Report pages fetched at once from one host, None for the full concurrency
+        self.parser_backend = "html.parser" # HTML parser used for every extraction
+        self.browser_workers = 1 # Chrome drivers scraping reports at once (browser mode only)
+        self.driver_pool = None # Created on first use
+        self.record_lock = threading.Lock() # Rows may be recorded from worker threads
+        self.current_url = None # URL of the driver's current navigation
+        self.html_cache = None # page_source of the current navigation
+        self.page_cache = None # Parsed page of the current navigation
+        self.metrics = CrawlMetrics() # Phase timings and counters
+        self.metrics_file = None # File the metrics are exported to (.prom or JSON), None to disable
+        self.metrics_interval = 10 # Seconds between metrics exports
+        self.metrics_exporter = None # Started with the output
+        self.retry_policy = RetryPolicy() # Backoff for transient fetch failures
+        self.rate_controller = RateController() # Adaptive request rate, limited to the crawl's parallelism
+        self.failed_items = {} # Dead-letter queue: report URL -> last error, retried when the crawl ends
+        self.failed_pages = {} # Listing pages that failed after retries -> last error
+        self.recovered_urls = set() # Dead-lettered URLs that succeeded on retry
+        self.killed = False # Set when the user kills the run, skips the final retry
+
+        # Callbacks to GUI (or CLI), ignored when not given
+        self.update_callback = update_callback or ignore_callback # Callback to set progress bar
+        self.output_callback = output_callback or ignore_callback # Callback to output text
+        self.warning_callback = warning_callback or ignore_callback # Callback to warning text
+        self.error_callback = error_callback or ignore_callback # Callback to error text
+        self.success_callback = success_callback or ignore_callback # Callback to success text
+
+        # Initalise filters
+        self.selected_countries = []  
+        self.selected_languages = []
+        self.selected_tags = []
+        self.start_date = None
+        self.end_date = None
+
+        # Initialise driver with URL (browser mode only, http mode never starts Chrome)
+        self.fetch_mode = fetch_mode
+        self.headless = headless # Run Chrome without a display
+        self.lean_browser = lean_browser # Block non-document resources and stop waiting at DOMContentLoaded
+        self.measure_transfer = False # Count the bytes of every browser page (one extra WebDriver call per page)
+        self.driver = None
+        if fetch_mode == "browser":
+            self.driver = self.setup_driver()
+            self.navigate(self.base_url)
+            self.wait_for_elements("a.b-archive__database-item", 5)
+
+        # Initialise fetch backend for report pages
+        self.cache_dir = cache_dir # Report page cache directory (http mode), None to disable
+        self.cache_max_age = cache_max_age # Seconds a cached page is used without revalidating
+        self.cache_max_bytes = cache_max_bytes # Cache size above which least recently used pages are evicted
+        self.http_fetcher = None # Uncached fetcher (http mode only)
+        self.fetcher = self.setup_fetcher(fetch_mode)
+
+
+    def setup_driver(self):
+        self.driver = self.create_driver()
+        self.success_callback("SUCCESS: Driver initialised.")
+        
+        return self.driver
+
+
+    # Create a Chrome driver with the scraper's options (also used by the driver pool)
+    def create_driver(self):
+        import undetected_chromedriver as uc # Undetected chromedriver from cloudflare systems
+
+        # Initialise the driver with specified options
+        driver = uc.Chrome(options=self.chrome_options()) 
+        if self.lean_browser:
+            # Blocked for every later navigation of this driver
+            driver.execute_cdp_cmd("Network.enable", {})
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": LEAN_BLOCKED_URLS})
+
+        # Chromedriver options continued, set window size
+        driver.set_window_size(600, 600)
+        return driver
+
+
+    def chrome_options(self):
+        from selenium.webdriver.chrome.options import Options as ChromeOptions
+
+        # Driver setup with detailed options
+        # Options help with speed of driver by disabling chrome features
+        options = ChromeOptions()
+        options.add_argument("--disable-blink-features=AutomationControlled")
+        options.add_argument("--no-sandbox")
+        options.add_argument("--disable-gpu")
+        options.add_argument("--disable-javascript")
+        options.add_argument("--disable-extensions")
+        options.add_argument('--disable-blink-features=AutomationControlled')
+        if self.headless:
+            options.add_argument("--headless=new")
+        if self.lean_browser:
+            # Return from get() once the DOM is parsed instead of after every resource has loaded
+            options.page_load_strategy = "eager"
+            options.add_argument("--blink-settings=imagesEnabled=false")
+        return options
+
+
+    # Create the backend used to load report pages
+    def setup_fetcher(self, fetch_mode):
+        if fetch_mode == "browser":
+            return BrowserFetcher(self)
+        elif fetch_mode == "http":
+            fetcher = HttpFetcher(user_agent=DEFAULT_USER_AGENT)
+            self.http_fetcher = fetcher # Uncached, also used for listing pages
+            self.success_callback("SUCCESS: HTTP fetcher initialised.")
+            if self.cache_dir:
+                fetcher = CachingFetcher(fetcher, HttpCache(self.cache_dir, self.cache_max_age, self.cache_max_bytes))
+                self.success_callback(f"SUCCESS: Report cache at {os.path.abspath(self.cache_dir)}")
+            return fetcher
+        raise ValueError(f"Unknown fetch mode: {fetch_mode}")
+
+
+    def scrape_page(self, page_html=None):
+        # Use the current driver page if no HTML is given
+        if page_html is None:
+            page_html = self.current_html()
+
+        # One "parse" observation covers building the tree and extracting the fields,
+        # lazy backends like selectolax do most of their work in report()
+        with self.metrics.time("parse"):
+            return parse_html(page_html, self.parser_backend).report()
+
+    # Parse HTML with the selected parser backend
+    def parse_html(self, page_html):
+        with self.metrics.time("parse"):
+            return parse_html(page_html, self.parser_backend)
+
+    # Navigate the driver, dropping the cached page of the previous navigation
+    def navigate(self, url):
+        self.html_cache = None
+        self.page_cache = None
+        self.driver.get(url)
+        self.current_url = url
+
+    # Count the bytes a browser navigation transferred, to compare browser profiles
+    # Costs a WebDriver round trip and waits for the load event, so it only runs when asked for
+    # and always after the page's timed phase
+    def count_transfer(self, driver):
+        if not self.measure_transfer:
+            return
+        try:
+            transferred = driver.execute_async_script(PAGE_TRANSFER_SCRIPT)
+        except WebDriverException:
+            return # No timing data for this page (e.g. an error page)
+        self.metrics.count("browser_pages")
+        self.metrics.count("browser_bytes", int(transferred or 0))
+
+    # HTML of the current page, transferred from the driver once per navigation
+    def current_html(self):
+        if self.html_cache is None:
+            with self.metrics.time("page_source"):
+                self.html_cache = self.driver.page_source
+        return self.html_cache
+
+    # Current page parsed once per navigation and shared by every extractor
+    def current_page(self):
+        if self.page_cache is None:
+            self.page_cache = self.parse_html(self.current_html())
+        return self.page_cache
+
     # Find total items found from filter search
     def fetch_total_items(self, next_page_link):
-        page_html = self.driver.page_source  # Get the HTML source of the page after navigating
-        page = BeautifulSoup(page_html, 'html.parser') 
+        total_items = self.current_page().total_items()
 
-        # Find total items content under "b-archive__results-count"
-        cases_div = page.find("div", class_="b-archive__results-count")
-        if cases_div:
-            self.total_items = int(cases_div.text.strip().split()[0])
+        if total_items is not None:
+            self.total_items = total_items
             self.output_callback(f"Total items found from filters: {self.total_items}")
             # Update loading bar
-            if self.update_callback:
-                self.update_callback(0, self.total_items)
+            self.update_callback(0, self.total_items)
             # Don't run again
             self.total_items_fetched = True 
 
 
     def accept_cookies(self):
         if self.driver:
+            # Only loaded when there is a browser to click in
+            from selenium.webdriver.common.by import By
+            from selenium.webdriver.support.ui import WebDriverWait
+            from selenium.webdriver.support import expected_conditions as EC
             try:
                 # Wait till cookies avaliable
                 wait = WebDriverWait(self.driver, 10)
@@ -206,17 +1678,12 @@ class Scraper:
         try:
             # Fix for database breaking after reaching large page numbers
             # Fixed by finding last page number (half) and sorting by oldest entry and repeating scrape
-            page_html = self.driver.page_source
-            page = BeautifulSoup(page_html, "html.parser")
-
-            pagination_items = page.select('a.b-pagination__item')[-1].get_text()  
+            pagination_items = self.current_page().last_pagination_item()
             if not pagination_items:
                 raise Exception
-            print(pagination_items)
             last_page = int(pagination_items) if pagination_items.isdigit() else 1
-            print(last_page)
             half_page = math.ceil(last_page / 2)
-            print(half_page)
+            self.output_callback(f"Last page is {last_page}, switching to ascending order at page {half_page}.")
             self.pagination_fetched = True
             return half_page
 
@@ -229,48 +1696,47 @@ class Scraper:
         
         self.pagination_fetched = True
 
-    # Write the list of scraped data dictionaries to a CSV file
+    # Close the streaming output and report where the data was saved
     def save_data(self):
-        if self.scraped_data:
-            try:
-                self.output_callback("Sorting and cleaning data...")
-                keys = self.scraped_data[0].keys()  # Get the keys from the first item in the list
-                
-                # Generate a timestamped filename (prevent overwriting)
-                timestamp = datetime.datetime.now().strftime("%Y%m%d-%H%M%S")
-                filename = f'euvsdisinfo_{timestamp}.csv'
-                full_path = os.path.abspath(filename)
-
-                # Create file
-                with open(filename, 'w', newline='', encoding='utf-8-sig') as output_file:
-                    dict_writer = csv.DictWriter(output_file, keys)
-                    dict_writer.writeheader()
-                    dict_writer.writerows(self.scraped_data)
-
-                # Preprocessing
-                df = pd.read_csv(filename)
-                df = df.drop_duplicates()
-                df.to_csv(filename, index=False, encoding='utf-8-sig')
-
-                self.success_callback(f"SUCCESS: Data saved to: {full_path}")
-
-            except IndexError:
-                self.warning_callback("WARNING: No data found. CSV file will not be created")
-            except Exception as e:
-                self.error_callback(f"ERROR: An unknown error occured while writing to CSV: {e}")
-        else:
+        if self.delta_mode and (self.sink is None or not self.sink.rows_written):
+            if self.sink:
+                self.sink.close()
+            self.output_callback("No new reports since the dataset was scraped.")
+            return
+        if self.sink is None:
             self.warning_callback("WARNING: No data found. CSV file will not be created")
+            return
+        try:
+            self.sink.close()
+            if self.sink.rows_written:
+                if self.sink.duplicates_skipped:
+                    self.output_callback(f"Skipped {self.sink.duplicates_skipped} duplicate items.")
+                self.success_callback(f"SUCCESS: Data saved to: {os.path.abspath(self.sink.filename)}")
+                if self.output_format == "parquet":
+                    self.output_callback("Writing Parquet file...")
+                    parquet_filename = csv_to_parquet(self.sink.filename)
+                    self.success_callback(f"SUCCESS: Parquet data saved to: {os.path.abspath(parquet_filename)}")
+            else:
+                self.warning_callback("WARNING: No data found. CSV file will not be created")
+        except Exception as e:
+            self.error_callback(f"ERROR: An unknown error occured while writing to CSV: {e}")
     
 
     # Create URL based on user set filters
-    def construct_url(self):
+    # Page, dates and sort order default to the scraper's current state
+    def construct_url(self, page_num=None, start_date=None, end_date=None, sort_order=None):
+        page_num = page_num or self.page_num
+        start_date = start_date or self.start_date
+        end_date = end_date or self.end_date
+        sort_order = sort_order or self.sort_order
+
         # Initialise with fixed parameters
-        fixed_params = ["view=grid", "numberposts=60", f"sort={self.sort_order}"]
+        fixed_params = ["view=grid", f"numberposts={ITEMS_PER_PAGE}", f"sort={sort_order}"]
         dynamic_params = []
 
         # Date parameters
-        if self.start_date and self.end_date:
-            dynamic_params.append(f"date={self.start_date}%20-%20{self.end_date}")
+        if start_date and end_date:
+            dynamic_params.append(f"date={start_date}%20-%20{end_date}")
 
         # Country parameters
         if self.selected_countries:
@@ -288,8 +1754,8 @@ class Scraper:
             dynamic_params.extend(tag_params)
 
         # Form the base URL
-        if self.page_num > 1:
-            page_url = f"{self.base_url}/page/{self.page_num}/?"
+        if page_num > 1:
+            page_url = f"{self.base_url}/page/{page_num}/?"
         else:
             page_url = f"{self.base_url}/?"
 
@@ -304,30 +1770,729 @@ class Scraper:
 
     # Wait for elements to load on page function
     def wait_for_elements(self, css_selector, timeout):
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support.ui import WebDriverWait
+        from selenium.webdriver.support import expected_conditions as EC
+
         # Wait for elements to be present on page
-        WebDriverWait(self.driver, timeout).until(EC.presence_of_all_elements_located((By.CSS_SELECTOR, css_selector)))
+        with self.metrics.time("wait"):
+            WebDriverWait(self.driver, timeout).until(EC.presence_of_all_elements_located((By.CSS_SELECTOR, css_selector)))
     
 
+    # Report cards of the current listing page, links with the title and date shown on each card
+    def harvest_listing_items(self):
+        return self.listing_items(self.current_page(), self.current_url)
+
+    # Report cards of a parsed listing page as rows, all taken from the one parse
+    def listing_items(self, page, page_url):
+        # Resolve relative links like the driver's href property does
+        return [{"Title": item["title"], "Date of publication": item["date"], "URL": urljoin(page_url, item["href"])}
+                for item in page.listing_items() if item["href"]]
+
+
+    # HTML of a report page from the fetch backend, transient failures are retried
+    def fetch_report(self, url):
+        return self.with_retry(self.fetch_report_once, url)
+
+    def fetch_report_once(self, url):
+        with self.rate_controller.slot():
+            with self.metrics.time("report_fetch"):
+                page_html = self.fetcher.fetch(url)
+            self.check_challenge(url, page_html)
+        self.metrics.count("report_pages")
+        if self.fetch_mode == "browser":
+            self.count_transfer(self.driver)
+        return page_html
+
+    # Listing page HTML over HTTP, paced by the rate controller like report pages
+    def fetch_listing(self, url):
+        with self.rate_controller.slot():
+            with self.metrics.time("listing"):
+                page_html = self.http_fetcher.fetch(url)
+            self.check_challenge(url, page_html)
+        return page_html
+
+    # A challenge page must not be parsed as a report
+    def check_challenge(self, url, page_html):
+        if is_challenge_page(page_html):
+            self.metrics.count("challenge_pages")
+            raise ChallengePageError(url)
+
+    # Most requests the crawl can have in flight, the rate controller's ceiling
+    def crawl_parallelism(self):
+        if self.fetch_mode == "browser":
+            return self.browser_workers if not self.sharded else 1
+        if self.sharded:
+            return self.shard_workers
+        # Every report is on the same host, so its limit caps the crawl
+        return min(self.concurrency, self.per_host_limit or self.concurrency)
+
+
+    # A keep-alive connection for every request the crawl can have in flight
+    def size_connection_pool(self):
+        if self.http_fetcher:
+            self.http_fetcher.resize(max(self.crawl_parallelism(), HTTP_POOL_SIZE))
+
+
+    # Call func with the scraper's retry policy, retries stop once the scraper is stopped
+    def with_retry(self, func, *args):
+        return self.retry_policy.call(func, *args, on_retry=self.retry_warning, cancelled=lambda: not self.scraping)
+
+    def retry_warning(self, error, attempt, delay):
+        self.metrics.count("retries")
+        self.warning_callback(f"WARNING: {error}, retry {attempt}/{self.retry_policy.attempts - 1} in {delay:.1f}s.")
+
+
+    # Queue a report that could not be scraped for the final retry
+    def item_failed(self, url, error, log=True):
+        self.dead_letter(url, "report", str(error))
+        self.metrics.count("failed_items")
+        if log:
+            self.error_callback(f"ERROR: Error scraping {url}: {error}")
+
+
+    # Add a report or listing page to the dead-letter queue, journaled so a resumed run retries it too
+    def dead_letter(self, url, kind, error):
+        with self.record_lock:
+            (self.failed_items if kind == "report" else self.failed_pages)[url] = error
+            self.journal.failed(url, kind, error)
+
+
+    # Drop a URL from the dead-letter queue once it succeeded
+    def recovered(self, url):
+        with self.record_lock:
+            self.failed_items.pop(url, None)
+            self.failed_pages.pop(url, None)
+            self.recovered_urls.add(url)
+            self.journal.recovered(url)
+
+
+    # Retry every failed listing page and report once the crawl has finished
+    def retry_failed(self):
+        if not (self.failed_items or self.failed_pages) or self.killed or self.fatal_error or self.item_limit_reached():
+            return
+        if not self.pause_event.is_set(): # Paused runs keep their queue for the dead-letter file
+            return
+        self.output_callback(f"Retrying {len(self.failed_items)} failed items and {len(self.failed_pages)} failed listing pages...")
+        self.scraping = True
+
+        # Items of recovered listing pages join the retry
+        for url in list(self.failed_pages):
+            try:
+                page = self.with_retry(self.load_listing, url)
+            except Exception as e:
+                self.dead_letter(url, "listing", str(e))
+                continue
+            self.recovered(url)
+            if self.index_only:
+                # Cards already recorded are skipped, they don't end the retry
+                self.index_listing([card for card in self.listing_items(page, url) if not self.stop_reason(card["URL"])])
+                continue
+            for item in [card["URL"] for card in self.listing_items(page, url)]:
+                if item not in self.failed_items and not self.stop_reason(item):
+                    self.dead_letter(item, "report", None)
+                    self.scraped_urls.add(item)
+
+        for url in list(self.failed_items):
+            self.pause_event.wait()
+            if not self.check_if_scraping() or self.item_limit_reached():
+                break
+            if url in self.sink.keys: # Scraped again by a resumed crawl
+                self.recovered(url)
+                continue
+            self.output_callback(f"Processing: {url}")
+            try:
+                self.scrape_item(url)
+                self.recovered(url)
+            except Exception as e:
+                self.dead_letter(url, "report", str(e))
+            finally:
+                self.report_progress()
+        self.scraping = False
+
+
+    # Write URLs that still failed to the dead-letter file, merged with the entries of earlier runs on the same output
+    def save_failed(self):
+        if self.output_filename is None:
+            return
+        filename = failed_filename(self.output_filename)
+        failed = {}
+        if os.path.exists(filename):
+            with open(filename, newline='', encoding='utf-8') as f:
+                for row in csv.DictReader(f):
+                    # Entries scraped since then are dropped
+                    if row["URL"] not in self.recovered_urls and not (self.sink and row["URL"] in self.sink.keys):
+                        failed[row["URL"]] = (row["Type"], row["Error"])
+        failed.update((url, ("listing", error)) for url, error in self.failed_pages.items())
+        failed.update((url, ("report", error)) for url, error in self.failed_items.items())
+        if not failed:
+            if os.path.exists(filename):
+                os.remove(filename)
+            return
+        with open(filename, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(["URL", "Type", "Error"])
+            writer.writerows(sorted(([url, kind, error] for url, (kind, error) in failed.items()), key=lambda row: row[1]))
+        items = sum(kind == "report" for kind, _ in failed.values())
+        self.warning_callback(f"WARNING: {items} items and {len(failed) - items} listing pages failed, "
+                              f"listed in: {os.path.abspath(filename)}")
+
+
+    # Index mode: record the cards of a listing page as rows, report pages are never requested
+    def index_listing(self, listing_items):
+        for item in listing_items:
+            url = item["URL"]
+            # Skip items recorded before the run was resumed
+            if url in self.resume_urls:
+                continue
+            stop_reason = self.stop_reason(url)
+            if stop_reason:
+                self.scraping = False
+                self.output_callback(stop_reason)
+                break
+            self.scraped_urls.add(url)
+            self.record_item(url, item)
+            if self.item_limit_reached():
+                self.scraping = False
+                self.output_callback(f"Reached the item limit of {self.max_items}...")
+                break
+        self.report_progress()
+
+
+    # Fetch and parse a single report page
+    def scrape_item(self, url):
+        page_html = self.fetch_report(url)
+        data = self.scrape_page(page_html)  # Scrape function call
+        self.record_item(url, data)
+        return data
+
+
+    # Check whether report pages should be scraped in parallel
+    def parallel_crawl_enabled(self):
+        if self.fetch_mode == "http":
+            return self.concurrency > 1
+        return self.browser_workers > 1
+
+
+    # Scrape the new links of a listing page with the async crawler or driver pool
+    def crawl_concurrently(self, item_links):
+        new_links = []
+        stop_reason = None
+        for item in item_links:
+            # Skip items scraped before the run was resumed
+            if item in self.resume_urls:
+                continue
+            # Stop at the first item already scraped
+            stop_reason = self.stop_reason(item)
+            if stop_reason:
+                break
+            new_links.append(item)
+
+        # Don't request more pages than the item limit allows
+        if self.max_items is not None:
+            new_links = new_links[:max(self.max_items - self.items_scraped, 0)]
+
+        self.scraped_urls.update(new_links) # Add items to set of URLs
+        self.crawl_links(new_links)
+
+        if stop_reason:
+            self.scraping = False
+            self.output_callback(stop_reason)
+
+        # Check for item limit
+        if self.item_limit_reached():
+            self.scraping = False
+            self.output_callback(f"Reached the item limit of {self.max_items}...")
+
+
+    # Scrape report links with the async crawler or driver pool
+    def crawl_links(self, links):
+        if self.fetch_mode == "http":
+            AsyncCrawler(self, self.concurrency, self.per_host_limit).run(links)
+        else:
+            if self.driver_pool is None:
+                self.driver_pool = DriverPool(self, self.browser_workers)
+            self.driver_pool.run(links)
+
+
+    # Re-scrape every cached report page without the network (e.g. after a parser fix)
+    def scrape_from_cache(self):
+        if not isinstance(self.fetcher, CachingFetcher):
+            self.warning_callback("WARNING: No report cache configured.")
+            return
+        self.open_sink()
+        for url, page_html in self.fetcher.cache.items():
+            try:
+                self.record_item(url, self.scrape_page(page_html))
+            except Exception as e:
+                self.error_callback(f"ERROR: Error scraping cached {url}: {e}")
+        self.output_callback(f"Scraped {self.items_scraped} cached reports.")
+
+
+    # Stream a scraped row to the output and count it
+    def record_item(self, url, data):
+        data["URL"] = url
+
+        # Without known URLs a delta scrape stops at the first report older than the dataset
+        if self.delta_since:
+            publication_date = parse_publication_date(data["Date of publication"])
+            if publication_date and publication_date < self.delta_since:
+                # Listing pages are newest first, sitemaps are in no useful order and shards stop on their own
+                if self.scraping and self.discovery == "listing" and not self.sharded:
+                    self.scraping = False
+                    self.output_callback("Reached reports older than the dataset, delta scrape complete.")
+                return
+
+        with self.record_lock:
+            # Parallel workers may finish past the limit
+            if self.item_limit_reached():
+                return
+            with self.metrics.time("save"):
+                written = self.sink.write(data)
+                if written:
+                    self.metrics.count("items_saved")
+                    if self.store:
+                        self.store.upsert(data)
+                else:
+                    self.metrics.count("duplicates_skipped")
+                self.journal.item(url) # Committed once the row is on disk
+            # Duplicates already in the output don't count toward the item limit or progress
+            if written:
+                self.items_scraped += 1
+
+
+    # Create the output sink (once per scraper)
+    def open_sink(self):
+        if self.sink is None:
+            if self.output_filename is None:
+                # Generate a timestamped filename (prevent overwriting)
+                timestamp = datetime.datetime.now().strftime("%Y%m%d-%H%M%S")
+                self.output_filename = f'euvsdisinfo_{timestamp}.csv'
+            self.sink = CsvSink(self.output_filename, INDEX_FIELDS if self.index_only else REPORT_FIELDS)
+        if self.database and self.index_only:
+            # Card rows have no report details, upserting them would blank stored reports
+            self.warning_callback("WARNING: Index mode does not write to the database.")
+            self.database = None
+        if self.database and self.store is None:
+            self.store = SqliteStore(self.database)
+        if self.journal is None:
+            self.journal = CrawlJournal(journal_filename(self.output_filename))
+            self.journal.start(self.crawl_settings())
+        if self.metrics_file and self.metrics_exporter is None:
+            self.metrics_exporter = MetricsExporter(self.metrics, self.metrics_file, self.metrics_interval)
+            self.metrics_exporter.start()
+
+
+    # Scrape only reports newer than an existing dataset and append them to it
+    def delta_from(self, filename):
+        newest_date = None
+        with open(filename, newline='', encoding='utf-8-sig') as f:
+            for row in csv.DictReader(f):
+                if row.get("URL"):
+                    self.known_urls.add(row["URL"])
+                publication_date = parse_publication_date(row.get("Date of publication"))
+                if publication_date and (newest_date is None or publication_date > newest_date):
+                    newest_date = publication_date
+
+        # Older datasets have no URL column, fall back to the newest publication date
+        if not self.known_urls:
+            self.delta_since = newest_date
+
+        # Newest reports first, stopping at known territory
+        self.delta_mode = True
+        self.delta_dataset = filename
+        self.sort_order = "desc"
+        self.output_filename = filename
+        self.output_callback(f"Delta scrape against {len(self.known_urls)} known reports, newest published {newest_date:%d.%m.%Y}." if newest_date
+                             else f"Delta scrape against {len(self.known_urls)} known reports.")
+
+
+    # Reason to stop the crawl at an item, None to scrape it
+    def stop_reason(self, item):
+        if item in self.scraped_urls:
+            return "Detected a repeated page..."
+        if item in self.known_urls:
+            return "Reached reports already in the dataset, delta scrape complete."
+        return None
+
+
+    # Delta shard crawls end the shard, not the crawl, at the first card already covered by the dataset
+    def delta_reached(self, card):
+        if card["URL"] in self.known_urls:
+            return True
+        publication_date = parse_publication_date(card["Date of publication"])
+        return bool(self.delta_since and publication_date and publication_date < self.delta_since)
+
+
+    # Filters and limits that define the crawl
+    def crawl_settings(self):
+        return {
+            "base_url": self.base_url,
+            "output_filename": self.output_filename,
+            "start_date": self.start_date,
+            "end_date": self.end_date,
+            "selected_countries": self.selected_countries,
+            "selected_languages": self.selected_languages,
+            "selected_tags": self.selected_tags,
+            "max_items": self.max_items,
+            "sharded": self.sharded,
+            "index_only": self.index_only,
+            "delta_dataset": self.delta_dataset,
+            "delta_since": self.delta_since.strftime(DATE_FORMAT) if self.delta_since else None,
+            "discovery": self.discovery,
+            "modified_since": self.modified_since,
+            "output_format": self.output_format,
+            "database": self.database
+        }
+
+
+    # Position of the crawl in the listing
+    def crawl_state(self):
+        return {
+            "page_num": self.page_num,
+            "sort_order": self.sort_order,
+            "halfway_reached": self.halfway_reached,
+            "pages_scraped": self.pages_scraped
+        }
+
+
+    # Restore a killed or crashed run from its journal
+    def resume(self, filename):
+        settings, state, urls, page_urls, shards, failed = CrawlJournal.load(filename)
+        for key, value in settings.items():
+            if key != "base_url":
+                setattr(self, key, value)
+
+        # Reload the reports a delta run started from, rows appended since then must not move its cut-off date
+        if self.delta_dataset:
+            delta_since = self.delta_since
+            self.delta_from(self.delta_dataset)
+            self.delta_since = datetime.datetime.strptime(delta_since, DATE_FORMAT) if delta_since else None
+        if state:
+            for key, value in state.items():
+                setattr(self, key, value)
+
+        # Items of the interrupted page are skipped, earlier ones still detect repeats
+        self.resume_urls = page_urls
+        self.scraped_urls = set(urls) - page_urls
+        self.items_scraped = len(urls)
+        self.done_shards = shards
+
+        # The dead-letter queue is retried again when the resumed crawl ends
+        self.failed_items = {url: error for url, (kind, error) in failed.items() if kind == "report"}
+        self.failed_pages = {url: error for url, (kind, error) in failed.items() if kind == "listing"}
+
+        # Rows batched but not committed before the run stopped are still in the CSV
+        if self.database and os.path.exists(self.output_filename):
+            self.store = SqliteStore(self.database)
+            self.store.import_csv(self.output_filename)
+
+        # Keep appending to the same output and journal
+        self.journal = CrawlJournal(filename, mode='a')
+        self.journal.last_state = state
+        self.output_callback(f"Resuming from page {self.page_num} in {self.sort_order} order with {self.items_scraped} items already scraped.")
+
+
+    # Update progress to loading bar
+    def report_progress(self):
+        total = self.total_items if self.max_items is None else self.max_items
+        self.update_callback(self.items_scraped, total, rate=self.rate_controller.status())
+
+
+    # Check for item limit
+    def item_limit_reached(self):
+        return self.max_items is not None and self.items_scraped >= self.max_items
+
+
     def check_if_scraping(self):
-        if not self.scraping or not self.driver:
+        if not self.scraping or not self.fetcher:
+            return False
+        # Browser mode also needs its driver
+        if self.fetch_mode == "browser" and not self.driver:
             return False
         return True
 
 
-    # Main scraper function
-    def run(self):
+    # Make a listing page the current page, False if no database items appear
+    def open_listing(self, url):
+        self.metrics.count("listing_pages")
+        if self.fetch_mode == "http":
+            page_html = self.fetch_listing(url)
+            self.current_url = url
+            self.html_cache = page_html
+            self.page_cache = None
+            return bool(self.current_page().item_links())
+
+        # Wait for database items to appear
+        with self.metrics.time("listing"):
+            self.navigate(url)
+            try:
+                self.wait_for_elements("a.b-archive__database-item", 3)
+                found = True
+            except TimeoutException:
+                found = False
+        self.count_transfer(self.driver)
+        return found
+
+
+    # Load and parse a listing page, over HTTP with the http engine so shards can run in parallel
+    def load_listing(self, url):
+        self.metrics.count("listing_pages")
+        if self.fetch_mode == "http":
+            return self.parse_html(self.fetch_listing(url))
+        with self.metrics.time("listing"):
+            self.navigate(url)
+            try:
+                self.wait_for_elements("a.b-archive__database-item", 3)
+            except TimeoutException:
+                pass # Empty result pages have no items to wait for
+        self.count_transfer(self.driver)
+        return self.current_page()
+
+
+    # Number of results for a date window, read from "b-archive__results-count"
+    def count_results(self, start, end):
+        url = self.construct_url(page_num=1, start_date=start.strftime(DATE_FORMAT), end_date=end.strftime(DATE_FORMAT))
+        return self.with_retry(self.load_listing, url).total_items() or 0
+
+
+    # Split a date range into windows whose results fit under the safe pagination depth
+    def plan_shards(self, start, end):
+        count = self.count_results(start, end)
+        if count <= SAFE_PAGE_DEPTH * ITEMS_PER_PAGE or start == end:
+            if start == end and count > SAFE_PAGE_DEPTH * ITEMS_PER_PAGE:
+                self.warning_callback(f"WARNING: {count} results on {start:%d.%m.%Y} exceed the safe pagination depth.")
+            return [(start.strftime(DATE_FORMAT), end.strftime(DATE_FORMAT), count)] if count else []
+        middle = start + (end - start) // 2
+        return self.plan_shards(start, middle) + self.plan_shards(middle + datetime.timedelta(days=1), end)
+
+
+    # Crawl every listing page of one shard, newest first
+    def crawl_shard(self, shard):
+        start, end, count = shard
+        last_page = math.ceil(count / ITEMS_PER_PAGE)
+        pages_failed = 0
+        reached = False # Delta scrape reached the dataset, the rest of the shard is older
+        for page_num in range(1, last_page + 1):
+            if reached:
+                break
+            self.pause_event.wait()
+            if not self.check_if_scraping():
+                return
+            url = self.construct_url(page_num=page_num, start_date=start, end_date=end, sort_order="desc")
+            try:
+                page = self.with_retry(self.load_listing, url)
+            except Exception as e:
+                if not is_transient(e):
+                    raise
+                # Left for the final retry, the shard stays unfinished in the journal
+                pages_failed += 1
+                self.dead_letter(url, "listing", str(e))
+                self.error_callback(f"ERROR: Listing page {url} failed, queued for a final retry: {e}")
+                continue
+            for card in self.listing_items(page, url):
+                item = card["URL"]
+                self.pause_event.wait()  # Pause here if pause_event is cleared
+                if not self.check_if_scraping():
+                    return
+                if self.delta_mode and self.delta_reached(card):
+                    reached = True
+                    break
+                # Shards don't overlap, so a known item was scraped before a resume
+                with self.record_lock:
+                    if item in self.scraped_urls:
+                        continue
+                    self.scraped_urls.add(item)
+
+                try:
+                    if self.index_only:
+                        self.record_item(item, card)
+                    else:
+                        self.output_callback(f"Processing: {item}")
+                        self.scrape_item(item)
+                except Exception as e:
+                    self.item_failed(item, e)
+                finally:
+                    self.report_progress()
+                    if self.item_limit_reached():
+                        if self.scraping:
+                            self.scraping = False
+                            self.output_callback(f"Reached the item limit of {self.max_items}...")
+                        return
+        if pages_failed:
+            self.warning_callback(f"WARNING: Shard {start} - {end} finished with {pages_failed} failed listing pages.")
+            return
+        self.journal.shard_done(shard)
+        self.output_callback(f"Finished shard {start} - {end} ({count} items).")
+
+
+    # Sitemap or REST page over HTTP, paced by the rate controller like listing pages
+    def fetch_discovery(self, fetcher, url):
+        with self.rate_controller.slot():
+            with self.metrics.time("discovery"):
+                body = fetcher.fetch(url)
+            self.check_challenge(url, body)
+        self.metrics.count("discovery_requests")
+        return body
+
+
+    # Every report URL with its last modified time, from a few bulk sitemap requests
+    def discover_reports(self):
+        # Sitemaps are plain XML, so they are read over HTTP even when reports need the browser
+        fetcher = self.http_fetcher or HttpFetcher(user_agent=DEFAULT_USER_AGENT)
+        discovery = SitemapDiscovery(lambda url: self.with_retry(self.fetch_discovery, fetcher, url), self.base_url)
         try:
-            self.scraping = True
-            self.scraped_data = [] # Clear previous data if any
-            self.output_callback("Starting scraper...")
-            self.accept_cookies()
+            reports = discovery.reports()
+        finally:
+            if fetcher is not self.http_fetcher:
+                fetcher.close()
+        for url, error in discovery.failed_sitemaps.items():
+            self.warning_callback(f"WARNING: Skipped sitemap {url}, its reports are not discovered: {error}")
+        self.output_callback(f"Discovered {len(reports)} reports in {discovery.requests} requests from {discovery.source}.")
+
+        # Cached report pages fetched after their last modification need no revalidation
+        if isinstance(self.fetcher, CachingFetcher):
+            self.fetcher.modified.update((url, modified.timestamp()) for url, modified in reports.items() if modified)
+        return reports
+
+
+    # Earliest last modification worth scraping, from modified_since or the newest report of a delta dataset
+    def modified_cutoff(self):
+        cutoffs = [datetime.datetime.strptime(self.modified_since, DATE_FORMAT)] if self.modified_since else []
+        if self.delta_since:
+            cutoffs.append(self.delta_since)
+        return max(cutoffs).replace(tzinfo=datetime.timezone.utc) if cutoffs else None
+
+
+    # Setup shared by every crawl mode
+    def start_crawl(self, message):
+        self.scraping = True
+        self.open_sink()
+        self.rate_controller.set_max_concurrency(self.crawl_parallelism())
+        self.size_connection_pool()
+        self.output_callback(message)
+        self.accept_cookies()
+
+
+    # Errors that end a crawl, handled the same way by every crawl mode
+    @contextlib.contextmanager
+    def crawl_errors(self):
+        try:
+            yield
+        except NoSuchWindowException as e:
+            self.fatal_error = e
+            self.error_callback("ERROR: Browser window closed unexpectedly.")
+        except WebDriverException as e:
+            self.fatal_error = e
+            self.error_callback(f"ERROR: WebDriver encountered an issue: {e}")
+        except KeyboardInterrupt as e:
+            self.fatal_error = e
+            self.error_callback("ERROR: Scraping interrupted by user, exiting scraper.")
         except Exception as e:
-            self.error_callback(f"ERROR: Initialisation error: {e}")
+            self.fatal_error = e
+            self.error_callback(f"ERROR: An unexpected error occured: {e}")
+        finally:
             self.scraping = False
-            return 
-        try:
+
+
+    # Crawl the report URLs listed by the site's sitemaps, without paginating the archive
+    def run_discovered(self):
+        if self.index_only:
+            self.warning_callback("WARNING: Index mode reads the listing cards, finding reports on the listing pages instead.")
+            return self.run()
+        with self.crawl_errors():
+            self.start_crawl("Starting sitemap scraper...")
+            if self.start_date or self.selected_countries or self.selected_languages or self.selected_tags:
+                self.warning_callback("WARNING: Sitemaps list every report, the date, country, language and tag filters are not applied.")
+
+            # Reports are resumed by item, there is no interrupted listing page
+            self.scraped_urls.update(self.resume_urls)
+            self.resume_urls = set()
+
+            reports = self.discover_reports()
+            cutoff = self.modified_cutoff()
+            # Unlike the newest-first listing, known reports are skipped rather than ending the crawl
+            links = [url for url, modified in reports.items()
+                     if url not in self.scraped_urls and url not in self.known_urls
+                     and not (cutoff and modified and modified < cutoff)]
+            if len(links) < len(reports):
+                self.output_callback(f"Skipping {len(reports) - len(links)} reports already scraped or not modified since the cutoff.")
+            self.total_items = self.items_scraped + len(links)
+            self.update_callback(self.items_scraped, self.total_items)
+
+            # Don't request more pages than the item limit allows
+            if self.max_items is not None:
+                links = links[:max(self.max_items - self.items_scraped, 0)]
+            self.scraped_urls.update(links)
+
+            if self.parallel_crawl_enabled():
+                self.crawl_links(links)
+            else:
+                for item in links:
+                    self.pause_event.wait()  # Pause here if pause_event is cleared
+                    if not self.check_if_scraping():
+                        break
+                    self.output_callback(f"Processing: {item}")
+                    try:
+                        self.scrape_item(item)
+                    except NoSuchWindowException:
+                        raise
+                    except Exception as e:
+                        self.item_failed(item, e)
+                    finally:
+                        self.report_progress()
+
+            if self.item_limit_reached():
+                self.output_callback(f"Reached the item limit of {self.max_items}...")
+            elif self.scraping:
+                self.output_callback("All discovered reports processed.")
+            self.retry_failed()
+
+
+    # Crawl the filtered archive as independent date shards
+    def run_sharded(self):
+        with self.crawl_errors():
+            self.start_crawl("Starting sharded scraper...")
+
+            # Shards are resumed by item, there is no interrupted listing page
+            self.scraped_urls.update(self.resume_urls)
+            self.resume_urls = set()
+
+            # Plan shards over the selected dates, or the whole archive
+            if self.start_date and self.end_date:
+                start = datetime.datetime.strptime(self.start_date, DATE_FORMAT).date()
+                end = datetime.datetime.strptime(self.end_date, DATE_FORMAT).date()
+            else:
+                start, end = ARCHIVE_START, datetime.date.today()
+            # Days before the newest report of a delta dataset hold nothing new
+            if self.delta_since:
+                start = max(start, self.delta_since.date())
+            shards = self.plan_shards(start, end) if start <= end else []
+            self.total_items = sum(shard[2] for shard in shards)
+            self.update_callback(self.items_scraped, self.total_items)
+            self.output_callback(f"Planned {len(shards)} date shards covering {self.total_items} items.")
+
+            # Skip shards finished before a resume
+            shards = [shard for shard in shards if (shard[0], shard[1]) not in self.done_shards]
+
+            # Shards only run in parallel over HTTP, a single driver must crawl them in turn
+            workers = self.shard_workers if self.fetch_mode == "http" else 1
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                for future in [executor.submit(self.crawl_shard, shard) for shard in shards]:
+                    future.result()
+
+            if self.scraping:
+                self.output_callback("All shards finished.")
+            self.retry_failed()
+
+
+    # Main scraper function
+    def run(self):
+        with self.crawl_errors():
+            self.start_crawl("Starting scraper...")
             while self.check_if_scraping():
                 self.pause_event.wait()
+                self.journal.page(self.crawl_state()) # Checkpoint the page about to be crawled
                 url_size_before_scraping = len(self.scraped_urls) 
                 try:
                     # Load the first or next page
@@ -340,85 +2505,90 @@ class Scraper:
                     
                     # Go to adjusted URL
                     self.output_callback(f"Navigating to: {next_page_link}")
-                    self.driver.get(next_page_link)
+                    if not self.with_retry(self.open_listing, next_page_link):
+                        self.scraping = False
+                        self.warning_callback("WARNING: No more items found...")
+                        break
 
                     # Check for total_items_fetch and half page (once)
+                    # Both read the same cached parse of this listing page
                     if not self.total_items_fetched and self.max_items is None:
                         self.fetch_total_items(next_page_link)
                     if not self.pagination_fetched:
                         half_page = self.pagination_info()
-
-                    # Wait for database items to appear
-                    try:
-                        self.wait_for_elements("a.b-archive__database-item", 3)
-                    except TimeoutException:
-                        self.scraping = False
-                        self.warning_callback("WARNING: No more items found...")
-                        break
                     
-                    # Find all items on the page
-                    items = self.driver.find_elements(By.CSS_SELECTOR, "a.b-archive__database-item")
+                    # Harvest every report card on the listing page once
+                    listing_items = self.harvest_listing_items()
+                    item_links = [item["URL"] for item in listing_items]
                     # Break if no items found
-                    if items is None or len(items) == 0:
+                    if not item_links:
                         self.scraping = False
                         self.output_callback("No more pages to process...")
                         break
                     
-                    # Loop through each item and apply scraping logic
-                    item_links = [item.get_attribute('href') for item in items]
-                    for item in item_links:
-                        self.pause_event.wait()  # Pause here if pause_event is cleared
-                        if not self.check_if_scraping():  # Check if scraping should still be active
-                            break  # Return if killed
+                    # Index mode keeps the cards themselves, one request covers the whole page
+                    if self.index_only:
+                        self.index_listing(listing_items)
+                        if self.scraping:
+                            self.pages_scraped += 1 # Increment counters
+                            self.page_num += 1
+                    # Crawl the whole listing page concurrently when enabled
+                    elif self.parallel_crawl_enabled():
+                        self.crawl_concurrently(item_links)
+                        if self.scraping:
+                            self.pages_scraped += 1 # Increment counters
+                            self.page_num += 1
+                    else:
+                        # Visit each report directly, the listing is never reloaded
+                        for item in item_links:
+                            self.pause_event.wait()  # Pause here if pause_event is cleared
+                            if not self.check_if_scraping():  # Check if scraping should still be active
+                                break  # Return if killed
+
+                            # Skip items scraped before the run was resumed
+                            if item in self.resume_urls:
+                                continue
                         
-                        # If item already scraped
-                        if item in self.scraped_urls:
-                            self.scraping = False
-                            self.output_callback("Detected a repeated page...")
-                            break
+                            # If item already scraped (or already in the dataset for a delta scrape)
+                            stop_reason = self.stop_reason(item)
+                            if stop_reason:
+                                self.scraping = False
+                                self.output_callback(stop_reason)
+                                break
                         
-                        # Scrape item
-                        self.output_callback(f"Processing: {item}")
-                        try: 
-                            self.scraped_urls.add(item) # Add item to set of URLs
-                            self.driver.get(item) 
-                            data = self.scrape_page()  # Scrape function call
-                            self.scraped_data.append(data)  # Append data to list
-                            self.items_scraped += 1
-                        except Exception as e:
-                            self.error_callback(f"ERROR: Error scraping {item}: {e}")
-                            continue
-                        except ConnectionResetError:
-                             self.error_callback(f"ERROR: Connection was reset when scraping")
-                             self.scraping = False
-                             break
-                        except NoSuchWindowException:
-                            self.error_callback("ERROR: Browser window closed unexpectedly.")
-                            self.scraping = False
-                            break
-
-                        finally:
-                            # Update progress to loading bar
-                            if self.max_items is None:
-                                self.update_callback(self.items_scraped, self.total_items)
-                            else:
-                                self.update_callback(self.items_scraped, self.max_items)
-
-                            # Check for item limit
-                            if self.max_items is not None and self.items_scraped >= self.max_items:
+                            # Scrape item
+                            self.output_callback(f"Processing: {item}")
+                            try: 
+                                self.scraped_urls.add(item) # Add item to set of URLs
+                                self.scrape_item(item)
+                            except NoSuchWindowException:
+                                self.error_callback("ERROR: Browser window closed unexpectedly.")
                                 self.scraping = False
-                                self.output_callback(f"Reached the item limit of {self.max_items}...")
                                 break
-
-                            # Only navigate back if scraping is still active
-                            if self.scraping:
-                                self.driver.back()
-                                self.wait_for_elements("a.b-archive__database-item", 5)
-
-                    else:
-                        self.pages_scraped += 1 # Increment counters
-                        self.page_num += 1
+                            except Exception as e:
+                                # Transient failures were already retried, the item waits for the final retry
+                                self.item_failed(item, e)
+                                continue
+
+                            finally:
+                                # Update progress to loading bar
+                                self.report_progress()
+
+                                # Check for item limit
+                                if self.item_limit_reached():
+                                    self.scraping = False
+                                    self.output_callback(f"Reached the item limit of {self.max_items}...")
+                                    break
+
+                        else:
+                            self.pages_scraped += 1 # Increment counters
+                            self.page_num += 1
                     
+                    # Items scraped before resuming count as this page's progress
+                    if self.resume_urls:
+                        self.scraped_urls.update(self.resume_urls)
+                        self.resume_urls = set()
+
                     # Break the loop if no new items were added
                     if len(self.scraped_urls) == url_size_before_scraping:
                         self.scraping = False
@@ -426,7 +2596,8 @@ class Scraper:
                         break  
 
                     # Check for halfway mark (fix for database breaking)
-                    if half_page and self.page_num >= half_page and not self.halfway_reached:
+                    # Delta scrapes stop long before the deep pages, so they never flip
+                    if half_page and self.page_num >= half_page and not self.halfway_reached and not self.delta_mode:
                         self.sort_order = "asc"  # Switch to ascending order
                         self.page_num = 1  # Restart from the first page
                         self.halfway_reached = True  # Prevent further changes in sort order
@@ -434,36 +2605,35 @@ class Scraper:
                         continue  # Skip the rest of the loop and start over with new sort order
                 
                 # Error catching
-                except TimeoutException:
-                    self.error_callback(f"ERROR: Timed out waiting for page {self.page_num} to load, skipping to next page.")
-                    self.page_num += 1 # Skip to next page
-                    continue
-
-                except NoSuchWindowException:
+                except NoSuchWindowException as e:
                     self.scraping = False
+                    self.fatal_error = e
                     self.error_callback("ERROR: Browser window closed unexpectedly.")
                     break
 
                 except Exception as e:
+                    if is_transient(e):
+                        # Listing page still failing after retries, its items are picked up by the final retry
+                        self.dead_letter(next_page_link, "listing", str(e))
+                        self.error_callback(f"ERROR: Listing page {self.page_num} failed, queued for a final retry: {e}")
+                        self.page_num += 1 # Skip to next page
+                        continue
                     self.scraping = False
+                    self.fatal_error = e
                     self.error_callback(f"ERROR: An unexpected error occured: {e}")
                     break
-        
-        except WebDriverException as e:
-            self.scraping = False
-            self.error_callback(f"ERROR: WebDriver encountered an issue: {e}")
 
-        except KeyboardInterrupt:
-            self.scraping = False
-            self.error_callback("ERROR: Scraping interrupted by user, exiting scraper.")
-
-        except Exception as e:
-            self.scraping = False
-            self.error_callback(f"ERROR: An unexpected error occured: {e}")
+            self.retry_failed()
     
 
     def complete_scraping_process(self): 
         try:
+            if isinstance(self.fetcher, CachingFetcher):
+                self.output_callback(self.fetcher.stats())
+            if self.fetcher:
+                self.fetcher.close()
+            if self.driver_pool:
+                self.driver_pool.close()
             if self.driver:
                 self.driver.quit()
                 self.success_callback("SUCCESS: Driver closed.")
@@ -471,11 +2641,37 @@ class Scraper:
             self.error_callback(f"ERROR: Exception during driver closure: {e}")
         finally:
             self.save_data() 
+            self.save_failed()
+            if self.store:
+                self.store.close()
+                self.success_callback(f"SUCCESS: {self.store.rows_written} items stored in: {os.path.abspath(self.store.filename)}")
+            if self.journal:
+                self.journal.close()
+            for line in self.metrics.summary():
+                self.output_callback(f"Timing {line}")
+            browser_line = self.metrics.browser_summary()
+            if browser_line:
+                self.output_callback(browser_line)
+            if self.metrics_exporter:
+                self.metrics_exporter.stop()
+                self.metrics_exporter = None
+                self.success_callback(f"SUCCESS: Metrics saved to: {os.path.abspath(self.metrics_file)}")
             self.driver = None
+            self.fetcher = None
+            self.driver_pool = None
             self.scraping = False
             self.success_callback("SUCCESS: Scraping terminated.")
 
 
+# GUI refresh interval, log lines waiting for the next refresh, and lines kept in the log widget
+UI_FRAME_MS = 100
+LOG_BUFFER_LINES = 1000
+LOG_WIDGET_LINES = 2000
+
+# Cache freshness windows offered in the GUI, in seconds
+CACHE_AGE_CHOICES = {"Revalidate": 0, "Reuse for 1 hour": 60 * 60, "Reuse for 1 day": 24 * 60 * 60}
+
+
 # User commands and GUI
 class ScraperGUI:
     def __init__(self, master):
@@ -486,6 +2682,14 @@ class ScraperGUI:
         self.scraper = None
         self.scrape_thread = None
         self.killing_scraper = False  # Track if a kill attempt is happening
+        self.resume_journal = None # Journal of a run to resume instead of using the filters
+        self.delta_dataset = None # Existing CSV to extend with newer reports
+
+        # Updates from the scraper thread, applied to the widgets once per frame
+        self.ui_lock = threading.Lock()
+        self.pending_output = deque(maxlen=LOG_BUFFER_LINES) # Oldest lines are dropped when full
+        self.dropped_output = 0 # Lines dropped since the last frame
+        self.pending_progress = None # Latest progress only
 
 
         # Framing
@@ -524,6 +2728,14 @@ class ScraperGUI:
         # Kill button
         self.exit_button = ctk.CTkButton(control_frame, text="Kill Scraper", command=self.kill_scraping)
         self.exit_button.pack(fill='x', pady=5)
+
+        # Resume button
+        self.resume_button = ctk.CTkButton(control_frame, text="Resume Run", command=self.resume_run)
+        self.resume_button.pack(fill='x', pady=5)
+
+        # Delta update button
+        self.delta_button = ctk.CTkButton(control_frame, text="Update Dataset", command=self.delta_update)
+        self.delta_button.pack(fill='x', pady=5)
         
         # Max items input
         self.max_items_label = ctk.CTkLabel(control_frame, text="Set Maximum Items:")
@@ -535,6 +2747,76 @@ class ScraperGUI:
         self.set_max_items_button = ctk.CTkButton(control_frame, text="Set Max Items", command=self.set_max_items)
         self.set_max_items_button.pack(pady=5)
 
+        # Fetch engine for report pages
+        self.fetch_mode_label = ctk.CTkLabel(control_frame, text="Report Fetch Engine:")
+        self.fetch_mode_label.pack(pady=(5, 0))
+
+        self.fetch_mode_menu = ctk.CTkOptionMenu(control_frame, values=list(FETCH_MODES))
+        self.fetch_mode_menu.set("http")
+        self.fetch_mode_menu.pack(pady=5)
+
+        # Keep report pages on disk between runs (http engine)
+        self.cache_checkbox = ctk.CTkCheckBox(control_frame, text="Cache Report Pages")
+        self.cache_checkbox.select()
+        self.cache_checkbox.pack(pady=5)
+
+        # How long a cached report page is used before it is revalidated
+        self.cache_age_menu = ctk.CTkOptionMenu(control_frame, values=list(CACHE_AGE_CHOICES))
+        self.cache_age_menu.set("Revalidate")
+        self.cache_age_menu.pack(pady=5)
+
+        # Skip images, fonts, stylesheets and trackers in Chrome (browser engine)
+        self.lean_browser_checkbox = ctk.CTkCheckBox(control_frame, text="Lean Browser")
+        self.lean_browser_checkbox.pack(pady=5)
+
+        # Number of report pages fetched at once (http engine)
+        self.concurrency_label = ctk.CTkLabel(control_frame, text="Parallel Reports:")
+        self.concurrency_label.pack(pady=(5, 0))
+
+        self.concurrency_menu = ctk.CTkOptionMenu(control_frame, values=["1", "2", "4", "8", "16"])
+        self.concurrency_menu.set("8")
+        self.concurrency_menu.pack(pady=5)
+
+        # Number of Chrome drivers scraping reports at once (browser engine)
+        self.browser_workers_label = ctk.CTkLabel(control_frame, text="Chrome Workers:")
+        self.browser_workers_label.pack(pady=(5, 0))
+
+        self.browser_workers_menu = ctk.CTkOptionMenu(control_frame, values=["1", "2", "3", "4", "6", "8"])
+        self.browser_workers_menu.set("1")
+        self.browser_workers_menu.pack(pady=5)
+
+        # Output format
+        self.output_format_label = ctk.CTkLabel(control_frame, text="Output Format:")
+        self.output_format_label.pack(pady=(5, 0))
+
+        self.output_format_menu = ctk.CTkOptionMenu(control_frame, values=list(OUTPUT_FORMATS))
+        self.output_format_menu.set("csv")
+        self.output_format_menu.pack(pady=5)
+
+        # Accumulate every run into one SQLite database
+        self.database_checkbox = ctk.CTkCheckBox(control_frame, text="Store in Database")
+        self.database_checkbox.pack(pady=5)
+
+        # Crawl independent date shards instead of flipping the sort order halfway
+        self.shard_checkbox = ctk.CTkCheckBox(control_frame, text="Shard by Date")
+        self.shard_checkbox.pack(pady=5)
+
+        # List cases from the listing cards only, without opening each report
+        self.index_checkbox = ctk.CTkCheckBox(control_frame, text="Index Only")
+        self.index_checkbox.pack(pady=5)
+
+        # Find reports in the site's sitemaps instead of paginating the archive
+        self.sitemap_checkbox = ctk.CTkCheckBox(control_frame, text="Discover from Sitemap")
+        self.sitemap_checkbox.pack(pady=5)
+
+        # HTML parser backend used for extraction
+        self.parser_backend_label = ctk.CTkLabel(control_frame, text="HTML Parser:")
+        self.parser_backend_label.pack(pady=(5, 0))
+
+        self.parser_backend_menu = ctk.CTkOptionMenu(control_frame, values=list(PARSER_BACKENDS))
+        self.parser_backend_menu.set("html.parser")
+        self.parser_backend_menu.pack(pady=5)
+
         # Calendar for start date
         self.temp_start_date = None
         self.start_date_label = ctk.CTkLabel(date_filter_frame, text="Start Date")
@@ -588,6 +2870,7 @@ class ScraperGUI:
         self.output_textbox.tag_config("error", foreground="red")
         self.output_textbox.tag_config("success", foreground="green")
         self.append_output("CONSOLE LOGS", "info")  
+        self.master.after(UI_FRAME_MS, self.flush_ui)
 
 
     # Create listboxes
@@ -686,50 +2969,103 @@ class ScraperGUI:
         setattr(self.scraper, f"selected_{filter_type}", selected_codes)
 
 
-    # Update GUI progress bar 
-    def update_progress(self, scraped_count, total=None):
-        def gui_update():
-            if total is not None and total > 0:
-                progress_fraction = scraped_count / total
-                self.progress_bar.set(progress_fraction)
-                percentage_text = f"Loading: {progress_fraction * 100:.2f}%"  # Format to 2 decimal places
-                self.progress_label.configure(text=percentage_text)  # Update the label text
-            elif total is not None:  # Handle the case where total is zero
-                self.progress_bar.set(0)
-                self.progress_label.configure(text="0%")
-
-        self.master.after(0, gui_update)  # Ensure GUI updates happen on the main thread
+    # Update GUI progress bar (any thread), only the latest value is drawn
+    def update_progress(self, scraped_count, total=None, rate=None):
+        with self.ui_lock:
+            self.pending_progress = (scraped_count, total, rate)
 
 
-    # Append message to output textbox with specified tag
+    # Append message to output textbox with specified tag (any thread), drawn on the next frame
     def append_output(self, message, tag_type="info"):
-        def do_append():
-            self.output_textbox.configure(state="normal")
-            self.output_textbox.insert("end", message + "\n", tag_type)
-            self.output_textbox.see("end")
-            self.output_textbox.configure(state="disabled")   
+        with self.ui_lock:
+            if len(self.pending_output) == self.pending_output.maxlen:
+                self.dropped_output += 1
+            self.pending_output.append((message, tag_type))
+
+
+    # Apply buffered log lines and the latest progress on the main thread, once per frame
+    def flush_ui(self):
+        with self.ui_lock:
+            lines = list(self.pending_output)
+            self.pending_output.clear()
+            dropped, self.dropped_output = self.dropped_output, 0
+            progress, self.pending_progress = self.pending_progress, None
+
+        if lines:
+            if dropped:
+                lines.insert(0, (f"... {dropped} log lines skipped", "warning"))
+            self.write_output(lines)
             # If error make sure button is reset
-            if tag_type == "error" and not self.scraper.scraping:
+            if self.scraper and not self.scraper.scraping and any(tag_type == "error" for _, tag_type in lines):
                 self.kill_scraping(ask_confirmation=False)
-                
-        self.master.after(0, do_append)
+        if progress:
+            self.draw_progress(*progress)
+
+        self.master.after(UI_FRAME_MS, self.flush_ui)
+
+
+    # Insert lines in one call and keep only the newest LOG_WIDGET_LINES
+    def write_output(self, lines):
+        chunks = []
+        for message, tag_type in lines:
+            chunks.extend((message + "\n", tag_type))
+        self.output_textbox.configure(state="normal")
+        self.output_textbox.insert("end", *chunks)
+        line_count = int(self.output_textbox.index("end-1c").split(".")[0])
+        if line_count > LOG_WIDGET_LINES:
+            self.output_textbox.delete("1.0", f"{line_count - LOG_WIDGET_LINES}.0")
+        self.output_textbox.see("end")
+        self.output_textbox.configure(state="disabled")
+
+
+    def draw_progress(self, scraped_count, total, rate):
+        if total is not None and total > 0:
+            progress_fraction = scraped_count / total
+            self.progress_bar.set(progress_fraction)
+            percentage_text = f"Loading: {progress_fraction * 100:.2f}%"  # Format to 2 decimal places
+            if rate:
+                percentage_text += f" ({rate['requests_per_second']} req/s, {rate['concurrency']} in flight)"
+            self.progress_label.configure(text=percentage_text)  # Update the label text
+        elif total is not None:  # Handle the case where total is zero
+            self.progress_bar.set(0)
+            self.progress_label.configure(text="0%")
 
 
     # Main process loop for the scraper
     def scrape_process(self):
-        # Initialise scraper with filters
-        self.fetch_max_items_to_scraper()
-        self.fetch_dates_to_scraper()
-        self.fetch_set_selected_filters("countries")
-        self.fetch_set_selected_filters("languages")
-        self.fetch_set_selected_filters("tags")
+        # Initialise scraper with filters, or with the journal's filters when resuming
+        if self.resume_journal:
+            self.scraper.resume(self.resume_journal)
+            self.resume_journal = None
+        else:
+            self.fetch_max_items_to_scraper()
+            self.fetch_dates_to_scraper()
+            self.fetch_set_selected_filters("countries")
+            self.fetch_set_selected_filters("languages")
+            self.fetch_set_selected_filters("tags")
+            self.scraper.output_format = self.output_format_menu.get()
+            self.scraper.database = "euvsdisinfo.db" if self.database_checkbox.get() else None
+            self.scraper.index_only = bool(self.index_checkbox.get())
+            self.scraper.discovery = "sitemap" if self.sitemap_checkbox.get() else "listing"
+            self.scraper.sharded = bool(self.shard_checkbox.get())
+            if self.delta_dataset:
+                self.scraper.delta_from(self.delta_dataset)
+                self.delta_dataset = None
+        self.scraper.concurrency = int(self.concurrency_menu.get())
+        self.scraper.browser_workers = int(self.browser_workers_menu.get())
+        self.scraper.parser_backend = self.parser_backend_menu.get()
 
         try:
             while self.scraper.scraping:
                 self.scraper.pause_event.wait()  # Wait if paused
                 if not self.scraper.scraping:
                     break  # Break loop if scraping was stopped during pause
-                self.scraper.run()  # Main scraping function
+                if self.scraper.discovery == "sitemap":
+                    self.scraper.run_discovered()
+                elif self.scraper.sharded:
+                    self.scraper.run_sharded()
+                else:
+                    self.scraper.run()  # Main scraping function
         finally:
             # Clean resources and reset state
             if self.scraper:
@@ -741,12 +3077,16 @@ class ScraperGUI:
     def start_pause(self):
         if not self.scraper:
             # Initialise the scraper and start it for the first time
-            self.scraper = Scraper("https://euvsdisinfo.eu/disinformation-cases", 
+            self.scraper = Scraper(BASE_URL, 
                                 update_callback=self.update_progress, 
                                 output_callback=lambda message: self.append_output(message, "info"),
                                 warning_callback=lambda message: self.append_output(message, "warning"),
                                 error_callback=lambda message: self.append_output(message, "error"),
-                                success_callback=lambda message: self.append_output(message, "success"))
+                                success_callback=lambda message: self.append_output(message, "success"),
+                                fetch_mode=self.fetch_mode_menu.get(),
+                                cache_dir="http_cache" if self.cache_checkbox.get() else None,
+                                cache_max_age=CACHE_AGE_CHOICES[self.cache_age_menu.get()],
+                                lean_browser=bool(self.lean_browser_checkbox.get()))
             self.scraper.scraping = True  # Ensure the scraping is set to True when starting
             self.scraper.pause_event = threading.Event()
             self.scraper.pause_event.set()  # Initially set to resume state
@@ -769,6 +3109,28 @@ class ScraperGUI:
             self.append_output("Scraping resumed.", "info")
                     
 
+    # Resume a killed or crashed run from its journal
+    def resume_run(self):
+        if self.scraper:
+            messagebox.showerror("Scraper Running", "Kill the current scraper before resuming another run.")
+            return
+        filename = filedialog.askopenfilename(title="Select run journal", filetypes=[("Scraper journal", "*.journal")])
+        if filename:
+            self.resume_journal = filename
+            self.start_pause()
+
+
+    # Append reports published since an existing CSV was scraped (same filters)
+    def delta_update(self):
+        if self.scraper:
+            messagebox.showerror("Scraper Running", "Kill the current scraper before updating a dataset.")
+            return
+        filename = filedialog.askopenfilename(title="Select dataset to update", filetypes=[("CSV files", "*.csv")])
+        if filename:
+            self.delta_dataset = filename
+            self.start_pause()
+
+
     # Kill scraper button
     def kill_scraping(self, ask_confirmation=True):
         def update_gui_post_kill():
@@ -780,12 +3142,13 @@ class ScraperGUI:
             return  # Exit if a kill attempt is already underway or completed
 
         if ask_confirmation:
-            if not messagebox.askyesno("Confirm", "Are you sure you want to kill the scraper? This will lose all progress."):
+            if not messagebox.askyesno("Confirm", "Are you sure you want to kill the scraper? Progress is saved and can be resumed later."):
                 return  # Exit the function if the user does not confirm
 
         if self.scraper:
             self.killing_scraper = True
             self.append_output("WARNING: Killing scraper.", "warning")
+            self.scraper.killed = True
             self.scraper.scraping = False
             self.scraper.pause_event.set()  # Ensure any pause state is exited
 
@@ -798,7 +3161,221 @@ class ScraperGUI:
 
 
 
+# Filter code files shipped next to the scraper
+FILTER_CODES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "filter_codes")
+FILTER_CODE_FILES = {
+    "countries": "countryregion_codes.json",
+    "languages": "language_codes.json",
+    "tags": "tag_codes.json"
+}
+
+# Exit codes for scheduled runs
+EXIT_OK = 0
+EXIT_FATAL = 1 # Crawl ended early on an error (resume from the journal)
+EXIT_USAGE = 2 # Bad arguments or filter names
+EXIT_NO_DATA = 3 # Crawl finished without scraping anything (a delta run with nothing new is OK)
+
+
+# Load a filter code file (display name -> site code)
+def load_filter_codes(filter_type):
+    with open(os.path.join(FILTER_CODES_DIR, FILTER_CODE_FILES[filter_type]), 'r') as f:
+        return json.load(f)
+
+
+# Resolve filter names (or raw codes) given on the command line
+def resolve_filter_codes(filter_type, names):
+    codes = load_filter_codes(filter_type)
+    lookup = {name.lower(): code for name, code in codes.items()}
+    known_codes = set(codes.values())
+    resolved = []
+    for name in names:
+        if name.lower() in lookup:
+            resolved.append(lookup[name.lower()])
+        elif name in known_codes:
+            resolved.append(name)
+        else:
+            raise ValueError(f"Unknown {filter_type[:-1]} filter: {name}")
+    return resolved
+
+
+# Validate a dd.mm.yyyy date argument
+def cli_date(text):
+    try:
+        datetime.datetime.strptime(text, DATE_FORMAT)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid date {text!r}, expected dd.mm.yyyy")
+    return text
+
+
+# Structured progress log, one JSON object per line on stdout
+class CliLogger:
+    def __init__(self, stream=sys.stdout):
+        self.stream = stream
+        self.lock = threading.Lock()
+        self.errors = 0
+
+    def emit(self, event, **fields):
+        record = {"time": datetime.datetime.now().isoformat(timespec='seconds'), "event": event, **fields}
+        with self.lock:
+            self.stream.write(json.dumps(record) + "\n")
+            self.stream.flush()
+
+    def callback(self, level):
+        def log(message):
+            if level == "error":
+                self.errors += 1
+            self.emit("log", level=level, message=message)
+        return log
+
+    def progress(self, scraped_count, total=None, rate=None):
+        if rate:
+            self.emit("progress", scraped=scraped_count, total=total, rate=rate)
+        else:
+            self.emit("progress", scraped=scraped_count, total=total)
+
+
+def build_arg_parser():
+    parser = argparse.ArgumentParser(description="Headless EUvsDisinfo scraper. Run without arguments for the GUI.")
+    parser.add_argument("--start-date", type=cli_date, help="Publication date range start (dd.mm.yyyy)")
+    parser.add_argument("--end-date", type=cli_date, help="Publication date range end (dd.mm.yyyy)")
+    parser.add_argument("--country", action="append", default=[], help="Country / region filter name or code (repeatable)")
+    parser.add_argument("--language", action="append", default=[], help="Article language filter name or code (repeatable)")
+    parser.add_argument("--tag", action="append", default=[], help="Tag filter name or code (repeatable)")
+    parser.add_argument("--max-items", type=int, help="Maximum items to scrape")
+    parser.add_argument("--output", help="Output CSV file (default: timestamped)")
+    parser.add_argument("--format", choices=OUTPUT_FORMATS, default="csv", help="Output format")
+    parser.add_argument("--database", help="SQLite database to upsert reports into")
+    parser.add_argument("--fetch-mode", choices=FETCH_MODES, default="http", help="Report page fetch engine")
+    parser.add_argument("--concurrency", type=int, default=8, help="Report pages fetched at once (http engine)")
+    parser.add_argument("--per-host-limit", type=int, help="Report pages fetched at once from one host (default: --concurrency)")
+    parser.add_argument("--browser-workers", type=int, default=1, help="Chrome drivers scraping at once (browser engine)")
+    parser.add_argument("--parser", choices=PARSER_BACKENDS, default="html.parser", help="HTML parser backend")
+    parser.add_argument("--cache-dir", default="http_cache", help="Report page cache directory")
+    parser.add_argument("--no-cache", action="store_true", help="Disable the report page cache")
+    parser.add_argument("--cache-max-age", type=int, default=CACHE_MAX_AGE, help="Seconds a cached report page is used without revalidating (0: always revalidate)")
+    parser.add_argument("--cache-max-bytes", type=int, default=CACHE_MAX_BYTES, help="Cache size above which least recently used pages are evicted")
+    parser.add_argument("--from-cache", action="store_true", help="Re-scrape every cached report page without the network, then exit")
+    parser.add_argument("--shard", action="store_true", help="Crawl date shards instead of flipping the sort order")
+    parser.add_argument("--discovery", choices=DISCOVERY_MODES, default="listing", help="Find reports on the listing pages or in the site's sitemaps")
+    parser.add_argument("--modified-since", type=cli_date, help="Sitemap discovery: skip reports last modified before this date (dd.mm.yyyy)")
+    parser.add_argument("--index", action="store_true", help="Only list the cases (title, date, URL) from the listing pages")
+    parser.add_argument("--resume", metavar="JOURNAL", help="Resume a killed or crashed run from its journal")
+    parser.add_argument("--delta", metavar="CSV", help="Append reports newer than an existing dataset")
+    parser.add_argument("--fixed-rate", action="store_true", help="Always use the full concurrency instead of adapting to the site")
+    parser.add_argument("--retries", type=int, default=3, help="Retries of a failed request before it is queued for the final retry")
+    parser.add_argument("--metrics", metavar="FILE", help="Export phase timings and counters (.prom for Prometheus text, JSON otherwise)")
+    parser.add_argument("--metrics-interval", type=float, default=10, help="Seconds between metrics exports")
+    parser.add_argument("--show-browser", action="store_true", help="Run Chrome with a visible window")
+    parser.add_argument("--lean-browser", action="store_true", help="Block images, fonts, stylesheets and trackers in Chrome and stop waiting at DOMContentLoaded")
+    parser.add_argument("--list-filters", choices=list(FILTER_CODE_FILES), help="Print filter names and codes, then exit")
+    return parser
+
+
+# Headless entry point, returns the process exit code
+def run_cli(argv):
+    args = build_arg_parser().parse_args(argv)
+
+    if args.list_filters:
+        for name, code in sorted(load_filter_codes(args.list_filters).items()):
+            print(f"{name}\t{code}")
+        return EXIT_OK
+
+    if bool(args.start_date) != bool(args.end_date):
+        print("Both --start-date and --end-date are required for a date filter.", file=sys.stderr)
+        return EXIT_USAGE
+    try:
+        countries = resolve_filter_codes("countries", args.country)
+        languages = resolve_filter_codes("languages", args.language)
+        tags = resolve_filter_codes("tags", args.tag)
+    except ValueError as e:
+        print(e, file=sys.stderr)
+        return EXIT_USAGE
+
+    logger = CliLogger()
+    for option, filename in (("--resume", args.resume), ("--delta", args.delta)):
+        if filename and not os.path.isfile(filename):
+            logger.emit("log", level="error", message=f"ERROR: {option} file not found: {filename}")
+            return EXIT_USAGE
+    try:
+        scraper = Scraper(BASE_URL,
+                          update_callback=logger.progress,
+                          output_callback=logger.callback("info"),
+                          warning_callback=logger.callback("warning"),
+                          error_callback=logger.callback("error"),
+                          success_callback=logger.callback("success"),
+                          fetch_mode=args.fetch_mode,
+                          cache_dir=None if args.no_cache else args.cache_dir,
+                          headless=not args.show_browser,
+                          lean_browser=args.lean_browser,
+                          cache_max_age=args.cache_max_age,
+                          cache_max_bytes=args.cache_max_bytes)
+    except Exception as e:
+        logger.emit("log", level="error", message=f"ERROR: Scraper initialisation failed: {e}")
+        return EXIT_FATAL
+
+    # Filters, or the journal's filters when resuming
+    try:
+        if args.resume:
+            scraper.resume(args.resume)
+        else:
+            scraper.start_date = args.start_date
+            scraper.end_date = args.end_date
+            scraper.selected_countries = countries
+            scraper.selected_languages = languages
+            scraper.selected_tags = tags
+            scraper.max_items = args.max_items
+            scraper.output_filename = args.output
+            scraper.output_format = args.format
+            scraper.database = args.database
+            scraper.sharded = args.shard
+            scraper.index_only = args.index
+            scraper.discovery = args.discovery
+            scraper.modified_since = args.modified_since
+            if args.delta:
+                scraper.delta_from(args.delta)
+    except Exception as e:
+        # Unreadable journal or dataset, the driver and connections still need closing
+        logger.emit("log", level="error", message=f"ERROR: Could not load {args.resume or args.delta}: {e}")
+        scraper.complete_scraping_process()
+        return EXIT_USAGE
+    scraper.concurrency = args.concurrency
+    scraper.per_host_limit = args.per_host_limit
+    scraper.browser_workers = args.browser_workers
+    scraper.parser_backend = args.parser
+    scraper.metrics_file = args.metrics
+    scraper.measure_transfer = bool(args.metrics)
+    scraper.metrics_interval = args.metrics_interval
+    scraper.retry_policy.attempts = args.retries + 1
+    scraper.rate_controller.enabled = not args.fixed_rate
+
+    scraper.pause_event.set()
+    try:
+        if args.from_cache:
+            scraper.scrape_from_cache()
+        elif scraper.discovery == "sitemap":
+            scraper.run_discovered()
+        elif scraper.sharded:
+            scraper.run_sharded()
+        else:
+            scraper.run()
+    finally:
+        scraper.complete_scraping_process()
+
+    logger.emit("summary", items_scraped=scraper.items_scraped, errors=logger.errors,
+                failed_items=len(scraper.failed_items), failed_pages=len(scraper.failed_pages),
+                output=scraper.output_filename, fatal_error=str(scraper.fatal_error) if scraper.fatal_error else None)
+    if scraper.fatal_error:
+        return EXIT_FATAL
+    if scraper.items_scraped == 0 and not scraper.delta_mode:
+        return EXIT_NO_DATA
+    return EXIT_OK
+
+
 if __name__ == "__main__":
+    # Any arguments run the headless scraper, none open the GUI
+    if len(sys.argv) > 1:
+        sys.exit(run_cli(sys.argv[1:]))
+    import_gui_modules()
     root = ctk.CTk()
     app = ScraperGUI(root)
     root._state_before_windows_set_titlebar_color = 'zoomed'
@@ -0,0 +1,66 @@
+# Browser profile benchmark: bytes and load time per page with the standard and the lean Chrome profile
+# Both profiles load the same listing and report pages from the local stand-in site, which link
+# a stylesheet, a web font and a per-report image like the live site
+# Usage: python benchmarks/browser_benchmark.py [--pages N] [--latency S]
+import argparse
+import os
+import sys
+
+BENCHMARKS_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(BENCHMARKS_DIR, "..", "EUvsDisinfoScraper"))
+import EUvsDisinfoScraper as scraper_module
+from standin_site import StandInSite
+
+PROFILES = {"standard": False, "lean": True}
+
+
+# KiB and milliseconds per report page for one profile, None if Chrome cannot start
+def measure(site, lean_browser, pages):
+    try:
+        scraper = scraper_module.Scraper(site.listing_url, fetch_mode="browser", headless=True, lean_browser=lean_browser)
+    except Exception as e:
+        print(f"  skipped: {str(e).splitlines()[0] if str(e) else type(e).__name__}")
+        return None
+    scraper.metrics = scraper_module.CrawlMetrics() # Leave out the startup navigation
+    scraper.measure_transfer = True
+    try:
+        for report in site.reports[:pages]:
+            # Timed until the report is usable, bytes are counted afterwards once the page has loaded
+            with scraper.metrics.time("report_fetch"):
+                scraper.navigate(site.report_url(report))
+                scraper.wait_for_elements(".b-report__title", 10)
+            scraper.count_transfer(scraper.driver)
+    finally:
+        scraper.driver.quit()
+    snapshot = scraper.metrics.snapshot()
+    loads = snapshot["phases"]["report_fetch"]
+    return {"kib": snapshot["counters"].get("browser_bytes", 0) / pages / 1024, "ms": loads["sum"] / loads["count"] * 1000}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare bytes and load time per page of the Chrome profiles.")
+    parser.add_argument("--pages", type=int, default=50, help="Report pages loaded per profile")
+    parser.add_argument("--latency", type=float, default=0.05, help="Mean seconds added to every response")
+    args = parser.parse_args()
+
+    site = StandInSite(max(args.pages, 60), args.latency).start()
+    print(f"{args.pages} report pages, latency {args.latency * 1000:.0f} ms")
+    print(f"{'profile':<10} {'KiB/page':>9} {'ms/page':>8}")
+    results = {}
+    for name, lean_browser in PROFILES.items():
+        result = measure(site, lean_browser, args.pages)
+        if result is None:
+            continue
+        results[name] = result
+        print(f"{name:<10} {result['kib']:>9.1f} {result['ms']:>8.0f}")
+    site.stop()
+
+    if len(results) == len(PROFILES):
+        standard, lean = results["standard"], results["lean"]
+        saved_kib, saved_ms = standard["kib"] - lean["kib"], standard["ms"] - lean["ms"]
+        print(f"{'saved':<10} {saved_kib:>9.1f} {saved_ms:>8.0f}  "
+              f"({saved_kib / standard['kib']:.0%} of bytes, {saved_ms / standard['ms']:.0%} of load time)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,165 @@
+# End-to-end crawl benchmark against the local stand-in site
+# Every crawl mode runs in a fresh interpreter and is checked for missing, duplicate and wrong rows
+# Usage: python benchmarks/crawl_benchmark.py [--reports N] [--latency S] [--failure-rate P] [--rate-limit N] [--modes NAME ...]
+import argparse
+import csv
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+BENCHMARKS_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(BENCHMARKS_DIR, "..", "EUvsDisinfoScraper"))
+from standin_site import StandInSite
+
+# Scraper settings per crawl mode
+MODES = {
+    "http-serial": {"fetch_mode": "http", "concurrency": 1},
+    "http-async": {"fetch_mode": "http", "concurrency": 8},
+    "http-async-fixed": {"fetch_mode": "http", "concurrency": 8, "fixed_rate": True}, # Without the rate controller
+    "http-sharded": {"fetch_mode": "http", "concurrency": 8, "sharded": True},
+    "http-cached": {"fetch_mode": "http", "concurrency": 8, "cache": True}, # Measured on a warm cache
+    "http-index": {"fetch_mode": "http", "concurrency": 8, "index_only": True}, # Listing cards only
+    "http-sitemap": {"fetch_mode": "http", "concurrency": 8, "discovery": "sitemap"},
+    "browser-serial": {"fetch_mode": "browser", "browser_workers": 1},
+    "browser-pool": {"fetch_mode": "browser", "browser_workers": 4},
+    "browser-lean": {"fetch_mode": "browser", "browser_workers": 1, "lean_browser": True}
+}
+
+# Fields checked against the site's data
+CHECKED_FIELDS = ["Title", "Outlet", "Date of publication", "Article language(s)",
+                  "Countries / regions discussed", "Summary", "Response", "URL"]
+INDEX_CHECKED_FIELDS = ["Title", "Date of publication", "URL"]
+
+
+# Run one crawl in this process and print its result as JSON (called in a subprocess)
+def run_mode(name, listing_url, output_dir):
+    import EUvsDisinfoScraper as scraper_module
+    settings = MODES[name]
+    errors = []
+    try:
+        scraper = scraper_module.Scraper(listing_url, error_callback=errors.append,
+                                         fetch_mode=settings["fetch_mode"], headless=True,
+                                         lean_browser=settings.get("lean_browser", False),
+                                         cache_dir=os.path.join(output_dir, "cache") if settings.get("cache") else None)
+    except Exception as e:
+        print(json.dumps({"skipped": str(e).splitlines()[0] if str(e) else type(e).__name__}))
+        return
+    scraper.output_filename = os.path.join(output_dir, f"{name}.csv")
+    scraper.concurrency = settings.get("concurrency", 1)
+    scraper.browser_workers = settings.get("browser_workers", 1)
+    scraper.sharded = settings.get("sharded", False)
+    scraper.index_only = settings.get("index_only", False)
+    scraper.discovery = settings.get("discovery", "listing")
+    scraper.rate_controller.enabled = not settings.get("fixed_rate", False)
+    scraper.pause_event.set()
+
+    start = time.perf_counter()
+    try:
+        if scraper.discovery == "sitemap":
+            scraper.run_discovered()
+        elif scraper.sharded:
+            scraper.run_sharded()
+        else:
+            scraper.run()
+    finally:
+        scraper.complete_scraping_process()
+    seconds = time.perf_counter() - start
+
+    print(json.dumps({"items": scraper.items_scraped, "seconds": seconds, "errors": len(errors),
+                      "peak_memory_mib": peak_memory_mib(), "output": scraper.output_filename}))
+
+
+# Peak resident memory of this process, None where the resource module is missing (Windows)
+def peak_memory_mib():
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / 2**20 if sys.platform == "darwin" else peak / 2**10 # Bytes on macOS, KiB on Linux
+
+
+def run_subprocess(name, listing_url, output_dir):
+    command = [sys.executable, os.path.abspath(__file__), "--run-mode", name, "--listing-url", listing_url, "--output-dir", output_dir]
+    result = subprocess.run(command, capture_output=True, text=True)
+    lines = result.stdout.strip().splitlines()
+    if result.returncode != 0 or not lines:
+        return {"skipped": (result.stderr.strip().splitlines() or ["crashed"])[-1]}
+    return json.loads(lines[-1])
+
+
+# Missing, duplicate, unexpected and wrong rows in a crawl's CSV
+# A crawl that wrote no CSV is missing every row
+def check_output(filename, expected, fields=CHECKED_FIELDS):
+    missing, duplicates, unexpected, wrong = set(expected), 0, 0, 0
+    seen = set()
+    if not os.path.exists(filename):
+        return {"missing": len(missing), "duplicates": duplicates, "unexpected": unexpected, "wrong": wrong}
+    with open(filename, newline='', encoding='utf-8-sig') as f:
+        for row in csv.DictReader(f):
+            url = row.get("URL")
+            if url in seen:
+                duplicates += 1
+                continue
+            seen.add(url)
+            if url not in expected:
+                unexpected += 1
+                continue
+            missing.discard(url)
+            if any(row.get(field) != expected[url][field] for field in fields):
+                wrong += 1
+    return {"missing": len(missing), "duplicates": duplicates, "unexpected": unexpected, "wrong": wrong}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark every crawl mode against a local stand-in site.")
+    parser.add_argument("--reports", type=int, default=1200, help="Synthetic reports served by the site")
+    parser.add_argument("--latency", type=float, default=0.0, help="Mean seconds added to every response")
+    parser.add_argument("--failure-rate", type=float, default=0.0, help="Share of requests that fail")
+    parser.add_argument("--rate-limit", type=int, help="Site answers 429 above this many requests in flight")
+    parser.add_argument("--modes", nargs="+", choices=list(MODES), default=list(MODES))
+    parser.add_argument("--run-mode", choices=list(MODES), help=argparse.SUPPRESS)
+    parser.add_argument("--listing-url", help=argparse.SUPPRESS)
+    parser.add_argument("--output-dir", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run_mode:
+        run_mode(args.run_mode, args.listing_url, args.output_dir)
+        return 0
+
+    site = StandInSite(args.reports, args.latency, args.failure_rate, rate_limit=args.rate_limit).start()
+    expected = site.expected_rows()
+    print(f"{len(expected)} reports, latency {args.latency * 1000:.0f} ms, failure rate {args.failure_rate:.0%}"
+          + (f", rate limit {args.rate_limit} in flight" if args.rate_limit else ""))
+    print(f"{'mode':<16} {'items':>6} {'items/s':>8} {'peak MiB':>9} {'429s':>6} {'errors':>7} {'missing':>8} {'dupes':>6} {'wrong':>6}")
+
+    failed = False
+    with tempfile.TemporaryDirectory() as output_dir:
+        for name in args.modes:
+            if MODES[name].get("cache"):
+                run_subprocess(name, site.listing_url, output_dir) # Warm the cache
+                for extension in (".csv", ".journal"):
+                    path = os.path.join(output_dir, name + extension)
+                    if os.path.exists(path):
+                        os.remove(path)
+            rate_limited = site.rate_limited
+            result = run_subprocess(name, site.listing_url, output_dir)
+            rate_limited = site.rate_limited - rate_limited
+            if "skipped" in result:
+                print(f"{name:<16}  skipped: {result['skipped']}")
+                continue
+            check = check_output(result["output"], expected,
+                                 INDEX_CHECKED_FIELDS if MODES[name].get("index_only") else CHECKED_FIELDS)
+            memory = f"{result['peak_memory_mib']:9.1f}" if result["peak_memory_mib"] is not None else f"{'n/a':>9}"
+            print(f"{name:<16} {result['items']:>6} {result['items'] / result['seconds']:>8.1f} {memory} {rate_limited:>6} {result['errors']:>7} "
+                  f"{check['missing']:>8} {check['duplicates']:>6} {check['wrong'] + check['unexpected']:>6}")
+            failed = failed or any(check.values())
+    site.stop()
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
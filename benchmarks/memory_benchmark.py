@@ -0,0 +1,75 @@
+# Memory benchmark: report rows held as dicts vs ReportRecord over a full-archive-sized dataset
+# Values are fresh string objects per row, as the parsers produce them
+# Usage: python benchmarks/memory_benchmark.py [rows]
+import os
+import random
+import sys
+import tracemalloc
+
+# Make the scraper module importable from the repo root
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "EUvsDisinfoScraper"))
+from EUvsDisinfoScraper import REPORT_FIELDS, empty_report
+
+LANGUAGES = ["Russian", "English", "German", "French", "Spanish", "Arabic", "Italian", "Czech",
+             "Polish", "Georgian", "Armenian", "Azerbaijani", "Ukrainian", "Hungarian", "Serbian"]
+COUNTRIES = ["Ukraine", "Russia", "US", "EU", "Germany", "Poland", "Lithuania", "Latvia", "Estonia",
+             "Georgia", "Syria", "UK", "France", "Belarus", "Moldova", "NATO", "Sweden", "Finland"]
+
+
+# Copy of a string as a new object, like text extracted from a parsed page
+def fresh(text):
+    return (text + " ")[:-1]
+
+
+# Synthetic reports with the value distribution of the real archive:
+# a few hundred outlets, a few thousand dates and small language / country combinations
+def synthetic_rows(count, seed=1):
+    rng = random.Random(seed)
+    outlets = [f"outlet-{n}.example" for n in range(400)]
+    dates = [f"{day:02d}.{month:02d}.{year}" for year in range(2015, 2025) for month in range(1, 13) for day in range(1, 29)]
+    for n in range(count):
+        yield {
+            "Title": f"Disinformation claim number {n} about {rng.choice(COUNTRIES)}",
+            "Outlet": fresh(rng.choice(outlets)),
+            "Date of publication": fresh(rng.choice(dates)),
+            "Article language(s)": fresh(", ".join(rng.sample(LANGUAGES, rng.randint(1, 2)))),
+            "Countries / regions discussed": fresh(", ".join(rng.sample(COUNTRIES, rng.randint(1, 4)))),
+            "Summary": f"Summary {n} " + "lorem ipsum dolor sit amet " * rng.randint(8, 20),
+            "Response": f"Response {n} " + "consectetur adipiscing elit " * rng.randint(10, 30),
+            "URL": f"https://euvsdisinfo.eu/report/claim-{n}/"
+        }
+
+
+def as_dict(row):
+    return row
+
+
+def as_record(row):
+    record = empty_report()
+    for field in REPORT_FIELDS:
+        record[field] = row[field]
+    return record
+
+
+# Bytes allocated to hold every row, measured with tracemalloc
+def measure(count, build):
+    tracemalloc.start()
+    rows = [build(row) for row in synthetic_rows(count)]
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del rows
+    return current
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    baseline = measure(count, as_dict)
+    print(f"{count} rows")
+    print(f"{'dict rows':<14} {baseline / 2**20:8.1f} MiB  {baseline / count:7.0f} B/row")
+    compact = measure(count, as_record)
+    print(f"{'ReportRecord':<14} {compact / 2**20:8.1f} MiB  {compact / count:7.0f} B/row  "
+          f"({(1 - compact / baseline) * 100:.0f}% less)")
+
+
+if __name__ == "__main__":
+    main()
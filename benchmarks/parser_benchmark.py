@@ -0,0 +1,94 @@
+# Parser backend parity check and micro-benchmark
+# Usage: python benchmarks/parser_benchmark.py [repeats]
+import glob
+import os
+import sys
+import time
+
+# Make the scraper module importable from the repo root
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "EUvsDisinfoScraper"))
+from EUvsDisinfoScraper import PARSER_BACKENDS, parse_html
+
+PAGES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "pages")
+
+
+# Load the saved report or listing pages
+def load_pages(pattern="report_*.html"):
+    pages = {}
+    for path in sorted(glob.glob(os.path.join(PAGES_DIR, pattern))):
+        with open(path, encoding="utf-8") as f:
+            pages[os.path.basename(path)] = f.read()
+    return pages
+
+
+# Backends that can be used in this environment
+def available_backends():
+    backends = []
+    for backend in PARSER_BACKENDS:
+        try:
+            parse_html("<html><title>x</title></html>", backend)
+            backends.append(backend)
+        except Exception as e:
+            print(f"Skipping {backend}: {e}")
+    return backends
+
+
+# Every backend must produce exactly the rows html.parser produces
+def check_parity(pages, backends):
+    mismatches = 0
+    for name, page_html in pages.items():
+        expected = parse_html(page_html, "html.parser").report()
+        for backend in backends:
+            result = parse_html(page_html, backend).report()
+            for field, value in expected.items():
+                if result[field] != value:
+                    mismatches += 1
+                    print(f"MISMATCH {name} [{backend}] {field}: {result[field]!r} != {value!r}")
+    return mismatches
+
+
+# Every backend must read the same cards and result count from listing pages
+def check_listing_parity(pages, backends):
+    mismatches = 0
+    for name, page_html in pages.items():
+        expected = parse_html(page_html, "html.parser")
+        for backend in backends:
+            result = parse_html(page_html, backend)
+            if result.listing_items() != expected.listing_items() or result.total_items() != expected.total_items():
+                mismatches += 1
+                print(f"MISMATCH {name} [{backend}] listing cards differ")
+    return mismatches
+
+
+# Mean parse + extract time per page for each backend
+def benchmark(pages, backends, repeats):
+    results = {}
+    for backend in backends:
+        start = time.perf_counter()
+        for _ in range(repeats):
+            for page_html in pages.values():
+                parse_html(page_html, backend).report()
+        elapsed = time.perf_counter() - start
+        results[backend] = elapsed / (repeats * len(pages)) * 1000
+    return results
+
+
+def main():
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    pages = load_pages()
+    backends = available_backends()
+
+    listings = load_pages("listing_*.html")
+    mismatches = check_parity(pages, backends) + check_listing_parity(listings, backends)
+    print(f"Parity: {len(pages)} report and {len(listings)} listing pages, {len(backends)} backends, {mismatches} mismatches")
+
+    baseline = None
+    for backend, ms in benchmark(pages, backends, repeats).items():
+        baseline = baseline or ms
+        print(f"{backend:<12} {ms:8.3f} ms/page  {baseline / ms:5.1f}x")
+
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
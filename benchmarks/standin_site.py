@@ -0,0 +1,388 @@
+# Local stand-in for euvsdisinfo.eu serving a synthetic disinformation database
+# Listing pages honour page/N, numberposts, sort, date and the country / language / tag filters
+# the scraper builds in construct_url, report pages use the real b-report markup
+# Report URLs are also listed in Yoast-style sitemaps or the WordPress REST API, for sitemap discovery
+# Pages link a stylesheet, a web font and a per-report image, so browser profiles can be compared
+# Usage: python benchmarks/standin_site.py [--reports N] [--latency S] [--failure-rate P] [--rate-limit N] [--discovery sitemap|rest] [--port PORT]
+import argparse
+import datetime
+import hashlib
+import html
+import json
+import os
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+FILTER_CODES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "EUvsDisinfoScraper", "filter_codes")
+DATE_FORMAT = "%d.%m.%Y"
+
+LISTING_PATH = re.compile(r"^/disinformation-cases(?:/page/(\d+))?/?$")
+REPORT_PATH = re.compile(r"^/report/([a-z0-9-]+)/?$")
+REPORT_SITEMAP_PATH = re.compile(r"^/report-sitemap(\d*)\.xml$")
+REST_REPORTS_PATH = "/wp-json/wp/v2/report"
+SITEMAP_SIZE = 1000 # URLs per sitemap, as Yoast SEO splits them
+
+# Theme assets shared by every page, cached by the browser like the live site's
+THEME = "/wp-content/themes/euvsdisinfo"
+STYLESHEET = f"""@font-face {{ font-family: "Site Sans"; src: url("{THEME}/site-sans.woff2") format("woff2"); }}
+body {{ font-family: "Site Sans", sans-serif; }}
+""" + "".join(f".b-block-{n} {{ margin: {n % 7}px; padding: {n % 5}px; }}\n" for n in range(800))
+ASSETS = {
+    f"{THEME}/style.css": ("text/css", STYLESHEET.encode("utf-8")),
+    f"{THEME}/site-sans.woff2": ("font/woff2", bytes(random.Random(2).getrandbits(8) for _ in range(48 * 1024)))
+}
+ASSET_CACHE_CONTROL = "max-age=3600"
+
+# Cover image of each report, never cached across reports
+COVER_PATH = re.compile(r"^/wp-content/uploads/report-(\d+)\.jpg$")
+COVER_IMAGE = bytes(random.Random(3).getrandbits(8) for _ in range(96 * 1024))
+
+HEAD_ASSETS = f'<link rel="stylesheet" href="{THEME}/style.css?ver=1.0">'
+
+OUTLETS = ["ria.ru", "sputniknews.com", "rt.com", "tass.ru", "news-front.info", "ukraina.ru", "iz.ru",
+           "regnum.ru", "vesti.ru", "pravda.ru", "southfront.org", "rusvesna.su", "topwar.ru", "zvezdaweekly.ru"]
+
+WORDS = ["Kremlin", "NATO", "sanctions", "elections", "Ukraine", "West", "biolabs", "Nazis", "sovereignty",
+         "provocation", "Russophobia", "referendum", "energy", "grain", "colour revolution", "puppet"]
+
+
+def load_codes(filename):
+    with open(os.path.join(FILTER_CODES_DIR, filename), encoding="utf-8") as f:
+        return json.load(f)
+
+
+# Deterministic synthetic reports covering the archive's date range
+def synthetic_reports(count, seed=1, start=datetime.date(2015, 1, 1), end=datetime.date(2024, 12, 31)):
+    rng = random.Random(seed)
+    countries = load_codes("countryregion_codes.json")
+    languages = load_codes("language_codes.json")
+    tags = load_codes("tag_codes.json")
+    country_names, language_names, tag_names = sorted(countries), sorted(languages), sorted(tags)
+    days = (end - start).days
+
+    reports = []
+    for n in range(count):
+        words = rng.sample(WORDS, 4)
+        report_countries = rng.sample(country_names, rng.randint(1, 3))
+        report_languages = rng.sample(language_names, rng.randint(1, 2))
+        report_tags = rng.sample(tag_names, rng.randint(1, 3))
+        report = {
+            "id": n,
+            "slug": f"{words[0].lower().replace(' ', '-')}-{words[1].lower().replace(' ', '-')}-{n}",
+            "title": f"The {words[0]} is behind the {words[1]} in {report_countries[0]}",
+            "outlet": rng.choice(OUTLETS),
+            "date": start + datetime.timedelta(days=rng.randint(0, days)),
+            "languages": report_languages,
+            "countries": report_countries,
+            "language_codes": {languages[name] for name in report_languages},
+            "country_codes": {countries[name] for name in report_countries},
+            "tag_codes": {tags[name] for name in report_tags},
+            "summary": f"Claim {n}: the {words[2]} was staged by the {words[3]}.",
+            "response": [f"Recurring pro-Kremlin narrative about the {words[2]}.",
+                         f"There is no evidence that the {words[3]} was involved."]
+        }
+        # Last edited up to a month after publication
+        report["modified"] = datetime.datetime.combine(report["date"] + datetime.timedelta(days=n % 30),
+                                                       datetime.time(12), datetime.timezone.utc)
+        reports.append(report)
+    return reports
+
+
+# Reports matching a listing query, in the query's sort order (desc: newest first)
+def matching_reports(reports, query):
+    selected = reports
+    if "date" in query:
+        start_text, end_text = query["date"][0].split(" - ")
+        start = datetime.datetime.strptime(start_text.strip(), DATE_FORMAT).date()
+        end = datetime.datetime.strptime(end_text.strip(), DATE_FORMAT).date()
+        selected = [report for report in selected if start <= report["date"] <= end]
+    for param, field in (("disinfo_countries[]", "country_codes"), ("disinfo_language[]", "language_codes"),
+                         ("disinfo_keywords[]", "tag_codes")):
+        if param in query:
+            codes = set(query[param])
+            selected = [report for report in selected if report[field] & codes]
+    descending = query.get("sort", ["desc"])[0] != "asc"
+    return sorted(selected, key=lambda report: (report["date"], report["id"]), reverse=descending)
+
+
+def report_page(report):
+    response = report["response"]
+    return f"""<!DOCTYPE html>
+<html lang="en-GB">
+<head>
+<meta charset="UTF-8">
+<title>Disinfo: {html.escape(report["title"])}</title>
+{HEAD_ASSETS}
+</head>
+<body class="report-template-default single single-report">
+<main class="b-main">
+<div class="b-report">
+  <h1 class="b-report__title">{html.escape(report["title"])}</h1>
+  <img class="b-report__image" src="/wp-content/uploads/report-{report["id"]}.jpg" alt="">
+  <ul class="b-report__details-list">
+    <li class="b-report__details-item">Outlet: <a href="https://{report["outlet"]}/{report["id"]}.html" target="_blank" rel="noopener">{report["outlet"]}<span class="screen-reader-text">(opens in a new tab)</span></a></li>
+    <li class="b-report__details-item">Date of publication: <span>{report["date"].strftime(DATE_FORMAT)}</span></li>
+    <li class="b-report__details-item">Article language(s): <span>{", ".join(report["languages"])}</span></li>
+    <li class="b-report__details-item">Countries / regions discussed: <span>{", ".join(report["countries"])}</span></li>
+  </ul>
+  <div class="b-report__summary">
+    <h2 class="b-report__summary-title">Summary</h2>
+    <div class="b-text"><p>{html.escape(report["summary"])}</p></div>
+  </div>
+  <div class="b-report__response">
+    <h2 class="b-report__response-title">Response</h2>
+    <div class="b-text"><p>{html.escape(response[0])}</p><p>{html.escape(response[1])}</p></div>
+  </div>
+</div>
+</main>
+<footer class="b-footer"><a class="c-button" href="#">Accept</a></footer>
+</body>
+</html>
+"""
+
+
+# Yoast-style sitemap index: the report sitemaps and a page sitemap the scraper must ignore
+def sitemap_index(report_count, base):
+    sitemaps = [f"{base}/report-sitemap{n if n > 1 else ''}.xml" for n in range(1, -(-report_count // SITEMAP_SIZE) + 1)]
+    entries = "\n".join(f"  <sitemap><loc>{url}</loc></sitemap>" for url in [f"{base}/page-sitemap.xml"] + sitemaps)
+    return f"""<?xml version="1.0" encoding="UTF-8"?>
+<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+{entries}
+</sitemapindex>
+"""
+
+
+def urlset(entries):
+    urls = "\n".join(f"  <url><loc>{html.escape(url)}</loc>" + (f"<lastmod>{modified}</lastmod>" if modified else "") + "</url>"
+                     for url, modified in entries)
+    return f"""<?xml version="1.0" encoding="UTF-8"?>
+<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+{urls}
+</urlset>
+"""
+
+
+def listing_page(reports, total, page_num, last_page, base):
+    cards = "\n".join(f"""<a class="b-archive__database-item" href="{base}/report/{report["slug"]}/">
+  <div class="b-archive__database-item-date">{report["date"].strftime(DATE_FORMAT)}</div>
+  <h3 class="b-archive__database-item-title">{html.escape(report["title"])}</h3>
+</a>""" for report in reports)
+    pagination = "".join(f'<a class="b-pagination__item" href="{base}/disinformation-cases/page/{n}/">{n}</a>'
+                         for n in sorted({1, page_num, last_page}) if n <= last_page)
+    return f"""<!DOCTYPE html>
+<html lang="en-GB">
+<head><meta charset="UTF-8"><title>Database - EUvsDisinfo</title>{HEAD_ASSETS}</head>
+<body>
+<main class="b-main">
+<div class="b-archive__results-count">{total} cases</div>
+<div class="b-archive__database">
+{cards}
+</div>
+<nav class="b-pagination">{pagination}</nav>
+</main>
+<footer class="b-footer"><a class="c-button" href="#">Accept</a></footer>
+</body>
+</html>
+"""
+
+
+# Threaded HTTP server for the synthetic database
+# latency: mean seconds added to every response (uniform from 0.5x to 1.5x)
+# failure_rate: share of requests answered with failure_status
+# break_depth: listing pages deeper than this come back empty, like the live site
+# rate_limit: requests in flight above this are answered with 429, like a rate limiting proxy
+# discovery: "sitemap" serves a sitemap index at /sitemap_index.xml, "rest" the WordPress REST API, None neither
+class StandInSite:
+    def __init__(self, reports=1200, latency=0.0, failure_rate=0.0, failure_status=503,
+                 break_depth=None, rate_limit=None, host="127.0.0.1", port=0, seed=1, discovery="sitemap"):
+        self.reports = synthetic_reports(reports, seed)
+        self.by_slug = {report["slug"]: report for report in self.reports}
+        self.latency = latency
+        self.failure_rate = failure_rate
+        self.failure_status = failure_status
+        self.break_depth = break_depth
+        self.rate_limit = rate_limit
+        self.discovery = discovery
+        self.active = 0 # Requests in flight
+        self.rate_limited = 0
+        self.rng = random.Random(seed)
+        self.rng_lock = threading.Lock()
+        self.requests = 0
+        self.failures = 0
+        self.server = ThreadingHTTPServer((host, port), self.handler_class())
+        self.server.daemon_threads = True
+        self.base = f"http://{host}:{self.server.server_address[1]}"
+        self.thread = None
+
+    # Listing URL to give the scraper in place of BASE_URL
+    @property
+    def listing_url(self):
+        return f"{self.base}/disinformation-cases"
+
+    def report_url(self, report):
+        return f"{self.base}/report/{report['slug']}/"
+
+    # Rows the scraper should produce for every report matching a query
+    def expected_rows(self, query=None):
+        rows = {}
+        for report in matching_reports(self.reports, query or {}):
+            url = self.report_url(report)
+            rows[url] = {
+                "Title": report["title"],
+                "Outlet": report["outlet"],
+                "Date of publication": report["date"].strftime(DATE_FORMAT),
+                "Article language(s)": ", ".join(report["languages"]),
+                "Countries / regions discussed": ", ".join(report["countries"]),
+                "Summary": report["summary"],
+                "Response": " ".join(report["response"]), # Paragraphs joined like the parser does
+                "URL": url
+            }
+        return rows
+
+    def handler_class(self):
+        site = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                site.handle(self)
+
+        return Handler
+
+    def handle(self, request):
+        with self.rng_lock:
+            self.requests += 1
+            self.active += 1
+            limited = self.rate_limit is not None and self.active > self.rate_limit
+            if limited:
+                self.rate_limited += 1
+            delay = self.latency * self.rng.uniform(0.5, 1.5)
+            failed = self.rng.random() < self.failure_rate
+            if failed:
+                self.failures += 1
+        try:
+            if delay:
+                time.sleep(delay)
+            if limited:
+                return self.send(request, 429, "<html><body>Too many requests</body></html>")
+            if failed:
+                return self.send(request, self.failure_status, "<html><body>Service unavailable</body></html>")
+            return self.respond(request)
+        finally:
+            with self.rng_lock:
+                self.active -= 1
+
+    def respond(self, request):
+        url = urlparse(request.path)
+        query = parse_qs(url.query)
+        listing = LISTING_PATH.match(url.path)
+        if listing:
+            return self.send(request, 200, self.listing(int(listing.group(1) or 1), query))
+
+        if url.path in ASSETS:
+            content_type, content = ASSETS[url.path]
+            return self.send(request, 200, content, {"Cache-Control": ASSET_CACHE_CONTROL}, content_type)
+        if COVER_PATH.match(url.path):
+            return self.send(request, 200, COVER_IMAGE, content_type="image/jpeg")
+
+        sitemap = self.sitemap(url.path) if self.discovery == "sitemap" else None
+        if sitemap is not None:
+            return self.send(request, 200, sitemap, content_type="application/xml; charset=UTF-8")
+        if self.discovery == "rest" and url.path.rstrip("/") == REST_REPORTS_PATH:
+            return self.rest(request, query)
+
+        report_match = REPORT_PATH.match(url.path)
+        report = self.by_slug.get(report_match.group(1)) if report_match else None
+        if report is None:
+            return self.send(request, 404, "<html><body>Not found</body></html>")
+
+        # Report pages never change, so they can be revalidated by ETag
+        etag = '"' + hashlib.md5(report["slug"].encode()).hexdigest() + '"'
+        if request.headers.get("If-None-Match") == etag:
+            return self.send(request, 304, "", {"ETag": etag})
+        return self.send(request, 200, report_page(report), {"ETag": etag})
+
+    # Sitemap served at a path, None if there is none
+    def sitemap(self, path):
+        if path == "/sitemap_index.xml":
+            return sitemap_index(len(self.reports), self.base)
+        if path == "/page-sitemap.xml":
+            return urlset([(f"{self.base}/disinformation-cases/", None), (f"{self.base}/about/", None)])
+        match = REPORT_SITEMAP_PATH.match(path)
+        if not match:
+            return None
+        start = (int(match.group(1) or 1) - 1) * SITEMAP_SIZE
+        return urlset((self.report_url(report), report["modified"].isoformat())
+                      for report in self.reports[start:start + SITEMAP_SIZE])
+
+    # WordPress REST collection, 400 past the last page like WordPress
+    def rest(self, request, query):
+        per_page = int(query.get("per_page", ["10"])[0])
+        page_num = int(query.get("page", ["1"])[0])
+        entries = self.reports[(page_num - 1) * per_page:page_num * per_page]
+        if page_num > 1 and not entries:
+            return self.send(request, 400, json.dumps({"code": "rest_post_invalid_page_number"}), content_type="application/json")
+        body = json.dumps([{"link": self.report_url(report),
+                            "modified_gmt": report["modified"].strftime("%Y-%m-%dT%H:%M:%S")} for report in entries])
+        return self.send(request, 200, body, content_type="application/json")
+
+    def listing(self, page_num, query):
+        selected = matching_reports(self.reports, query)
+        per_page = int(query.get("numberposts", ["10"])[0])
+        last_page = max(1, -(-len(selected) // per_page))
+        if self.break_depth and page_num > self.break_depth:
+            page = []
+        else:
+            page = selected[(page_num - 1) * per_page:page_num * per_page]
+        return listing_page(page, len(selected), page_num, last_page, self.base)
+
+    def send(self, request, status, body, headers=None, content_type="text/html; charset=UTF-8"):
+        content = body.encode("utf-8") if isinstance(body, str) else body
+        request.send_response(status)
+        request.send_header("Content-Type", content_type)
+        request.send_header("Content-Length", str(len(content)))
+        for name, value in (headers or {}).items():
+            request.send_header(name, value)
+        request.end_headers()
+        if content:
+            request.wfile.write(content)
+
+    def start(self):
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve a synthetic EUvsDisinfo database locally.")
+    parser.add_argument("--reports", type=int, default=1200, help="Number of synthetic reports")
+    parser.add_argument("--latency", type=float, default=0.0, help="Mean seconds added to every response")
+    parser.add_argument("--failure-rate", type=float, default=0.0, help="Share of requests that fail")
+    parser.add_argument("--failure-status", type=int, default=503, help="Status code of failed requests")
+    parser.add_argument("--break-depth", type=int, help="Listing pages deeper than this come back empty")
+    parser.add_argument("--rate-limit", type=int, help="Requests in flight above this are answered with 429")
+    parser.add_argument("--discovery", choices=["sitemap", "rest", "none"], default="sitemap", help="Bulk listing of report URLs")
+    parser.add_argument("--port", type=int, default=8000)
+    args = parser.parse_args()
+
+    site = StandInSite(args.reports, args.latency, args.failure_rate, args.failure_status, args.break_depth,
+                       args.rate_limit, port=args.port, discovery=None if args.discovery == "none" else args.discovery)
+    print(f"Serving {len(site.reports)} reports at {site.listing_url}")
+    try:
+        site.server.serve_forever()
+    except KeyboardInterrupt:
+        site.stop()
+
+
+if __name__ == "__main__":
+    main()
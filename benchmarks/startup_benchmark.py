@@ -0,0 +1,66 @@
+# Startup-time benchmark: interpreter start to first usable Scraper and to first GUI paint
+# Each measurement runs in a fresh interpreter so nothing is cached in sys.modules
+# Usage: python benchmarks/startup_benchmark.py [repeats]
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+SCRAPER_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "EUvsDisinfoScraper")
+
+# Interpreter start only, subtracted to show the module's own cost
+BASELINE = "pass"
+
+# First usable Scraper on the http engine (no Chrome, no network)
+SCRAPER = """
+import EUvsDisinfoScraper as m
+scraper = m.Scraper(m.BASE_URL, fetch_mode="http")
+"""
+
+# Headless scraper with browser libraries loaded, as a browser-mode run would need
+BROWSER_IMPORTS = """
+import EUvsDisinfoScraper as m
+scraper = m.Scraper(m.BASE_URL, fetch_mode="http")
+scraper.chrome_options()
+"""
+
+# First GUI paint: build the window and process pending draw events
+GUI = """
+import EUvsDisinfoScraper as m
+m.import_gui_modules()
+root = m.ctk.CTk()
+app = m.ScraperGUI(root)
+root.update()
+root.destroy()
+"""
+
+
+# Median wall time of a snippet in a fresh interpreter, None if it fails (e.g. no display)
+def measure(code, repeats):
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = subprocess.run([sys.executable, "-c", code], cwd=SCRAPER_DIR, capture_output=True)
+        elapsed = time.perf_counter() - start
+        if result.returncode != 0:
+            print(result.stderr.decode(errors="replace").strip().splitlines()[-1])
+            return None
+        times.append(elapsed)
+    return statistics.median(times) * 1000
+
+
+def main():
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    baseline = measure(BASELINE, repeats)
+    print(f"{'interpreter':<22} {baseline:8.1f} ms")
+    for name, code in [("first Scraper (http)", SCRAPER), ("+ browser libraries", BROWSER_IMPORTS), ("first GUI paint", GUI)]:
+        ms = measure(code, repeats)
+        if ms is None:
+            print(f"{name:<22}  skipped")
+        else:
+            print(f"{name:<22} {ms:8.1f} ms  (+{ms - baseline:.1f} ms over interpreter)")
+
+
+if __name__ == "__main__":
+    main()